@@ -19,26 +19,22 @@ Example:
 """
 
 import sys
+from functools import cache
 from os.path import exists
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Tuple
 
 # Ensure src is in path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import json
-
-import pandas as pd
 import typer
-from rich.console import Console
-from rich.json import JSON
-from rich.table import Table
 
-from src.config import Settings
-from src.connectors import FlexxusSync, GoogleMerchantFeed, GoogleSheetsUploader
-from src.core import MagentoAPIClient
-from src.operations import run_export_category, run_manual_update, run_monthly_report
-from src.processors import MarketingScorer, RFMProcessor
-from src.utils import get_logger, parse_comma_decimal, setup_file_logging
+# Heavy modules (pandas, rich, connectors, processors) are imported inside each
+# command so that --help and light commands don't pay for them at startup
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+    from src.config import Settings
 
 # Initialize Typer app
 app = typer.Typer(
@@ -48,13 +44,46 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-# Initialize console for rich output
-console = Console()
+@cache
+def get_console() -> "Console":
+    """Get the shared console for rich output (created on first use)."""
+    from rich.console import Console
+
+    return Console()
+
+
+def build_summary_table(key_header: str, rows: List[Tuple[str, str]]) -> "Table":
+    """Build a two-column summary table from pre-computed rows.
+    
+    Args:
+        key_header: Header for the first column (e.g., "Metrica")
+        rows: (name, value) pairs, in display order
+        
+    Returns:
+        Rich table ready to print
+    """
+    from rich.table import Table
+
+    table = Table(
+        show_header=True,
+        header_style="bold magenta",
+        expand=False,
+        pad_edge=False,
+    )
+    table.add_column(key_header, style="cyan")
+    table.add_column("Valor", style="green")
+
+    for row in rows:
+        table.add_row(*row)
 
+    return table
 
-def get_settings() -> Settings:
-    """Get validated settings."""
-    return Settings()
+
+def get_settings() -> "Settings":
+    """Get validated settings (loaded once per process)."""
+    from src.config.settings import get_settings as load_settings
+
+    return load_settings()
 
 
 @app.callback()
@@ -66,6 +95,8 @@ def main(
     Herramienta ETL para gestion de clientes y operaciones de Magento.
     Los logs tecnicos se guardan en logs/app.log
     """
+    from src.utils import setup_file_logging
+
     log_level = "DEBUG" if verbose else "INFO"
     log_file = setup_file_logging(level=log_level)
     # Logs tecnicos van al archivo, mensajes de usuario via console.print()
@@ -90,11 +121,30 @@ def rfm(
         "--upload/--no-upload",
         help="Subir resultados a Google Sheets"
     ),
+    refresh_catalog: bool = typer.Option(
+        False,
+        "--refresh-catalog",
+        help="Ignorar el catalogo en cache y descargarlo de nuevo"
+    ),
 ) -> None:
     """[bold green]Analisis RFM de clientes[/bold green].
     
     Genera analisis RFM (Recencia, Frecuencia, Valor Monetario) y sube a Google Sheets.
     """
+    import csv
+
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    from src.config.constants import CART_CSV_COLUMNS
+    from src.connectors import GoogleSheetsUploader
+    from src.core import MagentoAPIClient
+    from src.processors import MarketingScorer, RFMProcessor
+    from src.utils import get_logger, parse_comma_decimal_series
+
+    console = get_console()
     logger = get_logger(__name__)
     logger.info("rfm_command_started", year=year, sort_by=sort_by)
 
@@ -112,7 +162,7 @@ def rfm(
         console.print(f"[bold blue]Obteniendo datos desde {year}...[/bold blue]")
         df_customers = client.fetch_customers()
         df_orders = client.fetch_orders(min_year=year)
-        df_catalog = client.fetch_catalog()
+        df_catalog = client.fetch_catalog(use_cache=not refresh_catalog)
         df_items = client.fetch_order_items(min_year=year)
 
         console.print("[green]Datos obtenidos:[/green]")
@@ -153,37 +203,76 @@ def rfm(
             logger.warning("abandoned_carts_file_not_found", path=carts_path)
             df_carts_rfm = pd.DataFrame()
         else:
-            df_carts = pd.read_csv(carts_path)
-            df_carts['Email'] = df_carts['Email'].str.lower()
-            df_carts['Created'] = pd.to_datetime(df_carts['Created'], errors='coerce')
-            df_carts['Updated'] = pd.to_datetime(df_carts['Updated'], errors='coerce')
-            df_carts['Subtotal'] = (
-                df_carts['Subtotal']
-                .astype(str)
-                .str.replace('$', '', regex=False)
-                .str.replace(',', '', regex=False)
+            # Optional columns (e.g. Products, Quantity) may be missing from
+            # the export; only request the ones present in the header
+            with open(carts_path, newline='', encoding='utf-8-sig') as f:
+                header = next(csv.reader(f), [])
+            cart_columns = [col for col in CART_CSV_COLUMNS if col in header]
+
+            # Clean Email/Subtotal with Arrow kernels before converting to pandas
+            carts_table = pacsv.read_csv(
+                carts_path,
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=cart_columns,
+                    column_types={'Email': pa.string(), 'Subtotal': pa.string()},
+                    strings_can_be_null=True,
+                ),
             )
-            df_carts['Subtotal'] = pd.to_numeric(df_carts['Subtotal'], errors='coerce')
-            df_carts = df_carts.sort_values('Updated', ascending=False)
-
-            # Merge with RFM data and score
+            carts_table = carts_table.set_column(
+                carts_table.schema.get_field_index('Email'),
+                'Email',
+                pc.utf8_lower(carts_table['Email'])
+            )
+            carts_table = carts_table.set_column(
+                carts_table.schema.get_field_index('Subtotal'),
+                'Subtotal',
+                pc.replace_substring_regex(carts_table['Subtotal'], r'[$,]', '')
+            )
+            df_carts = carts_table.to_pandas(
+                types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get
+            )
+            # Arrow leaves the column unparsed if any value is not a date
+            for col in ['Created', 'Updated']:
+                if not pd.api.types.is_datetime64_any_dtype(df_carts[col]):
+                    df_carts[col] = pd.to_datetime(df_carts[col], errors='coerce')
+            df_carts['Subtotal'] = pd.to_numeric(
+                df_carts['Subtotal'], errors='coerce'
+            ).astype('float64')
+
+            # Enrich with RFM data and score
             console.print("[bold blue]Procesando carritos abandonados...[/bold blue]")
-            df_carts_rfm = df_carts.merge(
-                df_rfm,
-                left_on='Email',
-                right_on='Customer Email',
-                how='left'
+            # RFM emails are already lowercased by RFMProcessor; dedupe so the
+            # lookup cannot multiply cart rows
+            rfm_lookup = df_rfm.drop_duplicates('Customer Email').set_index('Customer Email')
+            rfm_cols = [
+                'LTV_Gasto_Total', 'Frecuencia', 'Recencia_Dias',
+                'Ticket_Promedio_Mensual', 'Categoria_Preferida',
+                'Es_Bahia_Blanca', 'Tiene_Factura_A'
+            ]
+            rfm_cols = [col for col in rfm_cols if col in rfm_lookup.columns]
+            # One reindex hashes the emails once for all columns (unmatched -> NaN)
+            df_carts_rfm = df_carts
+            df_carts_rfm[rfm_cols] = (
+                rfm_lookup[rfm_cols].reindex(df_carts_rfm['Email']).set_axis(df_carts_rfm.index)
             )
 
             # Convert numeric columns
-            for col in ['LTV_Gasto_Total', 'Ticket_Promedio_Mensual']:
-                if col in df_carts_rfm.columns:
-                    df_carts_rfm[col] = df_carts_rfm[col].apply(parse_comma_decimal)
+            decimal_cols = [
+                col for col in ['LTV_Gasto_Total', 'Ticket_Promedio_Mensual']
+                if col in df_carts_rfm.columns
+            ]
+            if decimal_cols:
+                df_carts_rfm[decimal_cols] = df_carts_rfm[decimal_cols].apply(
+                    parse_comma_decimal_series
+                )
 
             for col in ['Frecuencia', 'Recencia_Dias']:
                 if col in df_carts_rfm.columns:
-                    df_carts_rfm[col] = pd.to_numeric(df_carts_rfm[col], errors='coerce')
-                    df_carts_rfm[col] = df_carts_rfm[col].fillna(0)
+                    df_carts_rfm[col] = np.nan_to_num(
+                        pd.to_numeric(df_carts_rfm[col], errors='coerce')
+                        .to_numpy(dtype='float64', na_value=np.nan),
+                        nan=0.0
+                    )
 
             # Ensure required columns exist
             if 'Tiene_Factura_A' not in df_carts_rfm.columns:
@@ -205,13 +294,11 @@ def rfm(
                 'Score_Intencion', 'Segmento', 'Tipo_Cliente', 'Accion_Sugerida'
             ]
 
-            for c in columnas:
-                if c not in df_carts_rfm.columns:
-                    df_carts_rfm[c] = ""
-
-            df_carts_rfm = df_carts_rfm[columnas].sort_values(
+            df_carts_rfm = df_carts_rfm.reindex(columns=columnas, fill_value="").sort_values(
                 by=['Updated', 'Score_Intencion'],
-                ascending=[False, False]
+                ascending=[False, False],
+                kind='mergesort',
+                ignore_index=True
             )
 
             console.print(f"[green]Carritos procesados: {len(df_carts_rfm)}[/green]")
@@ -226,14 +313,10 @@ def rfm(
 
         # Show summary
         console.print("\n[bold green]Resumen del analisis:[/bold green]")
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Metrica", style="cyan")
-        table.add_column("Valor", style="green")
-
-        table.add_row("Total Clientes", str(len(df_rfm)))
-        table.add_row("Carritos Abandonados", str(len(df_carts_rfm)))
-
-        console.print(table)
+        console.print(build_summary_table("Metrica", [
+            ("Total Clientes", str(len(df_rfm))),
+            ("Carritos Abandonados", str(len(df_carts_rfm))),
+        ]))
 
         logger.info("rfm_command_completed")
 
@@ -250,11 +333,23 @@ def sync(
         "--apply-overrides/--no-overrides",
         help="Aplicar sobreescrituras de stock fijo"
     ),
+    refresh_catalog: bool = typer.Option(
+        False,
+        "--refresh-catalog",
+        help="Ignorar el catalogo en cache y descargarlo de nuevo"
+    ),
 ) -> None:
     """[bold blue]Sincronizacion de Stock y Precios[/bold blue].
     
     Sincroniza stock y precios desde archivos Flexxus hacia Magento.
     """
+    import numpy as np
+
+    from src.connectors import FlexxusSync
+    from src.core import MagentoAPIClient
+    from src.utils import get_logger
+
+    console = get_console()
     logger = get_logger(__name__)
     logger.info("sync_command_started")
 
@@ -270,8 +365,11 @@ def sync(
 
         # Get all Magento SKUs
         console.print("[bold blue]Obteniendo SKUs de Magento...[/bold blue]")
-        df_catalog = client.fetch_catalog()
-        magento_skus = set(df_catalog['sku'].apply(lambda x: str(x).strip().replace(' ', '').zfill(5)))
+        df_catalog = client.fetch_catalog(use_cache=not refresh_catalog)
+        skus = df_catalog['sku'].astype(str).to_numpy().astype(str)
+        magento_skus = set(
+            np.char.zfill(np.char.replace(np.char.strip(skus), ' ', ''), 5).tolist()
+        )
         console.print(f"[green]SKUs en Magento: {len(magento_skus)}[/green]")
 
         # Synchronize with Flexxus
@@ -283,18 +381,14 @@ def sync(
         console.print(f"Archivo exportado: {output_path}")
 
         # Show statistics
-        stats = sync_connector.get_statistics(pd.read_csv(output_path, sep=';'))
-
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Metrica", style="cyan")
-        table.add_column("Valor", style="green")
-
-        table.add_row("Total SKUs", str(stats['total_skus']))
-        table.add_row("Cantidad Total", str(stats['total_qty']))
-        table.add_row("Stock Overrides", str(stats['stock_overrides_applied']))
-        table.add_row("Precio Promedio", f"${stats['avg_price']:.2f}")
+        stats = sync_connector.get_statistics(sync_connector.last_synced)
 
-        console.print(table)
+        console.print(build_summary_table("Metrica", [
+            ("Total SKUs", str(stats['total_skus'])),
+            ("Cantidad Total", str(stats['total_qty'])),
+            ("Stock Overrides", str(stats['stock_overrides_applied'])),
+            ("Precio Promedio", f"${stats['avg_price']:.2f}"),
+        ]))
 
         logger.info("sync_command_completed", output_path=output_path)
 
@@ -311,11 +405,21 @@ def merchant(
         "--output", "-o",
         help="Directorio de salida para el archivo TSV"
     ),
+    refresh_catalog: bool = typer.Option(
+        False,
+        "--refresh-catalog",
+        help="Ignorar el catalogo en cache y descargarlo de nuevo"
+    ),
 ) -> None:
     """[bold yellow]Generar feed para Google Merchant[/bold yellow].
     
     Genera archivo TSV compatible con Google Merchant Center.
     """
+    from src.connectors import GoogleMerchantFeed
+    from src.core import MagentoAPIClient
+    from src.utils import get_logger
+
+    console = get_console()
     logger = get_logger(__name__)
     logger.info("merchant_command_started", output_dir=output_dir)
 
@@ -331,14 +435,15 @@ def merchant(
 
         # Fetch catalog
         console.print("[bold blue]Obteniendo catalogo de productos...[/bold blue]")
-        df_catalog = client.fetch_catalog()
+        df_catalog = client.fetch_catalog(use_cache=not refresh_catalog)
         console.print(f"[green]Productos obtenidos: {len(df_catalog)}[/green]")
 
         # Generate feed
         console.print("[bold blue]Generando feed de Google Merchant...[/bold blue]")
         feed = GoogleMerchantFeed(
             categories_file_path=settings.google_categories_path,
-            output_path=output_dir
+            output_path=output_dir,
+            cache_dir=str(Path(settings.catalog_cache_path).parent)
         )
         output_file = feed.generate(df_catalog)
 
@@ -375,6 +480,10 @@ def qr(
     
     Genera codigos QR para todos los productos de una categoria.
     """
+    from src.operations import run_export_category
+    from src.utils import get_logger
+
+    console = get_console()
     logger = get_logger(__name__)
     logger.info("qr_command_started", category_id=category_id, output_dir=output_dir)
 
@@ -391,8 +500,10 @@ def qr(
 
             if result.get("csv_data"):
                 console.print("\n[bold]Vista previa (primeros 10):[/bold]")
-                for item in result["csv_data"][:10]:
-                    console.print(f"  - {item['sku']}: {item['articulo']}")
+                console.print("\n".join(
+                    f"  - {item['sku']}: {item['articulo']}"
+                    for item in result["csv_data"][:10]
+                ))
         else:
             console.print(f"[bold yellow]{result.get('message', 'Error')}[/bold yellow]")
 
@@ -421,12 +532,21 @@ def manual_update(
         "--dry-run/--apply",
         help="Solo previsualizar sin aplicar cambios"
     ),
+    bulk: bool = typer.Option(
+        False,
+        "--bulk",
+        help="Encolar los cambios via la API bulk asincronica de Magento"
+    ),
 ) -> None:
     """[bold red]Actualizacion masiva de descripciones cortas[/bold red].
     
     Inyecta HTML en productos sin descripcion corta de una categoria.
     Requiere confirmacion si --apply (no dry-run).
     """
+    from src.operations import run_manual_update
+    from src.utils import get_logger
+
+    console = get_console()
     logger = get_logger(__name__)
     logger.info("manual_update_command_started", category_id=category_id, dry_run=dry_run)
 
@@ -443,7 +563,8 @@ def manual_update(
             settings,
             category_id=category_id,
             html_content=html_content,
-            dry_run=dry_run
+            dry_run=dry_run,
+            bulk=bulk
         )
 
         if result["dry_run"]:
@@ -453,8 +574,10 @@ def manual_update(
 
             if result.get("products_preview"):
                 console.print("\n[bold]Primeros 10 productos que se actualizaran:[/bold]")
-                for item in result["products_preview"]:
-                    console.print(f"  - {item['sku']}: {item['name']}")
+                console.print("\n".join(
+                    f"  - {item['sku']}: {item['name']}"
+                    for item in result["products_preview"]
+                ))
 
             console.print("\n[bold]Para aplicar cambios, ejecutar:[/bold]")
             console.print(f"  python main.py manual-update --category {category_id} --apply")
@@ -462,6 +585,8 @@ def manual_update(
             if result["success"]:
                 console.print("[bold green]Actualizacion completada![/bold green]")
                 console.print(f"Productos actualizados: {result['products_updated']}")
+                if result.get("bulk"):
+                    console.print("[blue]Cambios encolados: Magento los aplica con el consumer async.operations.all[/blue]")
                 if result.get("products_failed", 0) > 0:
                     console.print(f"[bold yellow]Productos con errores: {result['products_failed']}[/bold yellow]")
             else:
@@ -490,7 +615,12 @@ def monthly_report(
     output: str = typer.Option(
         None,
         "--output", "-o",
-        help="Path de salida para el archivo Excel"
+        help="Path de salida para el reporte"
+    ),
+    output_format: str = typer.Option(
+        "xlsx",
+        "--format", "-f",
+        help="Formato de salida: xlsx, parquet o feather"
     ),
 ) -> None:
     """[bold green]Reporte mensual de productos cargados[/bold green].
@@ -498,6 +628,10 @@ def monthly_report(
     Genera reporte Excel con productos creados en un mes especifico,
     agrupados por marca con estadisticas de crossselling/upselling.
     """
+    from src.operations import run_monthly_report
+    from src.utils import get_logger
+
+    console = get_console()
     logger = get_logger(__name__)
     logger.info("monthly_report_command_started", year=year, month=month)
 
@@ -508,7 +642,8 @@ def monthly_report(
             settings,
             year=year,
             month=month,
-            output_path=output
+            output_path=output,
+            output_format=output_format
         )
 
         if result["success"]:
@@ -517,6 +652,8 @@ def monthly_report(
                 console.print(f"Periodo: {result['month_name']} {result['year']}")
                 console.print(f"Productos cargados: {result['products_count']}")
                 console.print(f"Archivo: {result['output_path']}")
+                if result.get("summary_path"):
+                    console.print(f"Resumen: {result['summary_path']}")
             else:
                 console.print(f"[bold yellow]{result['message']}[/bold yellow]")
         else:
@@ -542,6 +679,11 @@ def validate(
     
     Verifica que toda la configuracion necesaria este correctamente definida.
     """
+    from src.connectors import GoogleSheetsUploader
+    from src.core import MagentoAPIClient
+    from src.utils import get_logger
+
+    console = get_console()
     logger = get_logger(__name__)
     logger.info("validate_command_started")
 
@@ -553,15 +695,11 @@ def validate(
 
         console.print("[bold green]Configuracion valida![/bold green]")
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Configuracion", style="cyan")
-        table.add_column("Valor", style="green")
-
-        table.add_row("Magento URL", settings.magento_url)
-        table.add_row("Spreadsheet", settings.spreadsheet_name)
-        table.add_row("Flexxus Folder", settings.flexxus_stock_folder)
-
-        console.print(table)
+        console.print(build_summary_table("Configuracion", [
+            ("Magento URL", settings.magento_url),
+            ("Spreadsheet", settings.spreadsheet_name),
+            ("Flexxus Folder", str(settings.flexxus_stock_folder)),
+        ]))
 
         if not env_only:
             # Test connections
@@ -619,6 +757,14 @@ def product(
         python main.py product 00042 --output producto.json
         python main.py product 00042 --compact | jq .
     """
+    import json
+
+    from rich.json import JSON
+
+    from src.core import MagentoAPIClient
+    from src.utils import get_logger
+
+    console = get_console()
     logger = get_logger(__name__)
     logger.info("product_command_started", sku=sku)
 
@@ -5,6 +5,8 @@ from .constants import (
     OrderStatus,
     SortBy,
     FIXED_STOCK_OVERRIDES,
+    FIXED_STOCK_OVERRIDE_KEYS,
+    FIXED_STOCK_OVERRIDE_VALUES,
     MARKETING_THRESHOLDS,
     CACHE_TTL,
 )
@@ -14,6 +16,8 @@ __all__ = [
     "OrderStatus",
     "SortBy",
     "FIXED_STOCK_OVERRIDES",
+    "FIXED_STOCK_OVERRIDE_KEYS",
+    "FIXED_STOCK_OVERRIDE_VALUES",
     "MARKETING_THRESHOLDS",
     "CACHE_TTL",
 ]
\ No newline at end of file
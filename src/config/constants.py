@@ -72,6 +72,16 @@ RFM_COLUMNS = [
     "Es_Bahia_Blanca",
 ]
 
+# Columns read from the abandoned carts export (everything else is skipped)
+CART_CSV_COLUMNS = [
+    "Email",
+    "Products",
+    "Quantity",
+    "Subtotal",
+    "Created",
+    "Updated",
+]
+
 CART_COLUMNS = [
     "Email",
     "Products",
@@ -98,6 +108,24 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) MagentoAutomation/2.0"
 # Cache TTL in seconds (24 hours)
 CACHE_TTL = 86400
 
+# Lifetime in seconds of a cached admin token (Magento's default is 4 hours)
+TOKEN_CACHE_TTL = 3 * 3600
+
+# TTL in seconds for in-process lookup maps (categories, attribute options)
+LOOKUP_CACHE_TTL = 3600
+
+# Page sizes for bulk endpoints, used unless page_size is set explicitly.
+# Fewer, larger pages save round-trips; orders are smaller because each
+# one carries its items.
+PAGE_SIZE_BY_ENDPOINT: Dict[str, int] = {
+    "/orders": 500,
+    "/products": 1000,
+    "/customers/search": 1000,
+}
+
+# Operations per request sent to Magento's asynchronous bulk endpoints
+BULK_CHUNK_SIZE = 100
+
 # Fixed stock overrides (from original stock_sync.py)
 FIXED_STOCK_OVERRIDES: Dict[str, int] = {
     "1021": 90,
@@ -124,3 +152,12 @@ FIXED_STOCK_OVERRIDES: Dict[str, int] = {
     "1675": 10,
     "1678": 4,
 }
+
+# Overrides as sorted, zero-padded (normalized) SKU keys with aligned quantities,
+# for vectorized lookups with np.isin/np.searchsorted (arrays are built by
+# the Flexxus connector so importing constants does not load NumPy)
+_SORTED_STOCK_OVERRIDES = sorted(
+    (sku.zfill(5), qty) for sku, qty in FIXED_STOCK_OVERRIDES.items()
+)
+FIXED_STOCK_OVERRIDE_KEYS: Tuple[str, ...] = tuple(sku for sku, _ in _SORTED_STOCK_OVERRIDES)
+FIXED_STOCK_OVERRIDE_VALUES: Tuple[int, ...] = tuple(qty for _, qty in _SORTED_STOCK_OVERRIDES)
@@ -4,6 +4,8 @@ This module provides centralized configuration management using Pydantic Setting
 All environment variables are validated at startup.
 """
 
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 from pydantic import Field, field_validator, ValidationInfo
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -23,9 +25,12 @@ class Settings(BaseSettings):
         spreadsheet_name: Name of the Google Sheets spreadsheet
         api_timeout: Timeout for API requests in seconds
         api_retries: Number of retries for failed API requests
+        api_concurrency: Maximum concurrent requests when fetching pages
         page_size: Number of items per page for paginated API calls
         flexxus_stock_folder: Path to folder containing Flexxus stock CSV files
         categories_cache_path: Path to categories cache JSON file
+        catalog_cache_path: Path to product catalog cache Parquet file
+        token_cache_path: Path to Magento admin token cache JSON file
         merchant_output_path: Path for Google Merchant output TSV file
         google_categories_path: Path to Google categories taxonomy file
     """
@@ -78,6 +83,12 @@ class Settings(BaseSettings):
         le=10,
         description="Number of retries for failed API requests"
     )
+    api_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="Maximum number of concurrent requests when fetching pages"
+    )
     page_size: int = Field(
         default=200,
         ge=1,
@@ -86,7 +97,7 @@ class Settings(BaseSettings):
     )
     
     # File Paths
-    flexxus_stock_folder: str = Field(
+    flexxus_stock_folder: Path = Field(
         default=r"C:\Users\USUARIO\Desktop\Exportacion de Precios y Stock",
         description="Path to folder containing Flexxus stock CSV files"
     )
@@ -94,6 +105,14 @@ class Settings(BaseSettings):
         default="categories_cache.json",
         description="Path to categories cache JSON file"
     )
+    catalog_cache_path: str = Field(
+        default=".cache/catalog.parquet",
+        description="Path to product catalog cache Parquet file"
+    )
+    token_cache_path: str = Field(
+        default=".cache/magento_token.json",
+        description="Path to Magento admin token cache JSON file"
+    )
     merchant_output_path: str = Field(
         default="feed_merchant_center.tsv",
         description="Path for Google Merchant output TSV file"
@@ -114,6 +133,16 @@ class Settings(BaseSettings):
         # Remove trailing slash for consistency
         return v.rstrip("/")
     
+    @field_validator("flexxus_stock_folder")
+    @classmethod
+    def validate_flexxus_folder(cls, v: Path) -> Path:
+        """Expand the Flexxus folder path once, at load time.
+        
+        Existence is checked when the folder is scanned, so commands that
+        don't use Flexxus still work on machines without it.
+        """
+        return v.expanduser()
+    
     @field_validator("magento_user", "magento_password")
     @classmethod
     def validate_not_empty(cls, v: str, info: ValidationInfo) -> str:
@@ -124,11 +153,13 @@ class Settings(BaseSettings):
 
 
 # Global settings instance - lazy loaded
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get or create settings instance.
     
     This function creates a singleton pattern for settings,
-    ensuring they are loaded only once and reused.
+    ensuring they are loaded only once and reused. Call
+    ``get_settings.cache_clear()`` to force a reload (e.g., in tests).
     
     Returns:
         Settings instance with validated configuration
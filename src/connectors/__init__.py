@@ -1,11 +1,40 @@
-"""Magento Automation System - Connectors Module."""
+"""Magento Automation System - Connectors Module.
 
-from .google_sheets import GoogleSheetsUploader
-from .merchant import GoogleMerchantFeed
-from .flexxus import FlexxusSync
+Connectors are imported on first access (PEP 562) so that importing one of
+them does not load the dependencies of the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .google_sheets import GoogleSheetsUploader
+    from .merchant import GoogleMerchantFeed
+    from .flexxus import FlexxusSync
+
+_LAZY_IMPORTS = {
+    "GoogleSheetsUploader": ".google_sheets",
+    "GoogleMerchantFeed": ".merchant",
+    "FlexxusSync": ".flexxus",
+}
 
 __all__ = [
     "GoogleSheetsUploader",
     "GoogleMerchantFeed",
     "FlexxusSync",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a connector class the first time it is accessed."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include the lazily imported connectors in dir()."""
+    return sorted(list(globals()) + __all__)
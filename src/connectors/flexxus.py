@@ -4,22 +4,142 @@ This module provides the FlexxusSync class for synchronizing stock and price
 data from Flexxus CSV files with Magento.
 """
 
+import codecs
+import csv
 import os
-import glob
-from typing import Optional, List, Dict, Set
+from functools import lru_cache
+from typing import Optional, List, Dict, Iterator, Set, Tuple
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import structlog
 
-from ..utils.helpers import normalize_sku
+from ..utils.helpers import normalize_sku_series
 from ..config.settings import Settings, get_settings
-from ..config.constants import FIXED_STOCK_OVERRIDES
+from ..config.constants import (
+    FIXED_STOCK_OVERRIDES,
+    FIXED_STOCK_OVERRIDE_KEYS,
+    FIXED_STOCK_OVERRIDE_VALUES,
+)
 from ..core.exceptions import DataProcessingError, FileNotFoundError
 
 logger = structlog.get_logger(__name__)
 
+# Normalized override SKUs, for membership tests
+_NORMALIZED_OVERRIDE_SET = frozenset(FIXED_STOCK_OVERRIDE_KEYS)
+
+# Encodings and separators accepted in Flexxus exports, in order of preference
+_CSV_ENCODINGS = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252', 'utf-8-sig']
+_CSV_SEPARATORS = [';', ',', '\t']
+_CSV_SNIFF_BYTES = 65536
+
+_REQUIRED_COLUMNS = ['sku', 'qty', 'price']
+
+# Files at least this large are loaded in chunks, filtered as they are read
+_CHUNKED_LOAD_MIN_BYTES = 100 * 1024 * 1024
+_CSV_CHUNK_ROWS = 200_000
+
+
+def _detect_csv_format(csv_path: str) -> Optional[Tuple[str, str]]:
+    """Detect the encoding and separator of a CSV from its first bytes.
+    
+    Args:
+        csv_path: Path to CSV file
+        
+    Returns:
+        (encoding, separator) tuple, or None if detection fails
+    """
+    try:
+        with open(csv_path, 'rb') as f:
+            head = f.read(_CSV_SNIFF_BYTES)
+    except OSError:
+        return None
+    
+    if head.startswith(codecs.BOM_UTF8):
+        candidates = ['utf-8-sig']
+    else:
+        candidates = [enc for enc in _CSV_ENCODINGS if enc != 'utf-8-sig']
+    
+    for encoding in candidates:
+        try:
+            # Incremental decode so a character cut at the sample end is not an error
+            sample = codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+            dialect = csv.Sniffer().sniff(sample, delimiters=''.join(_CSV_SEPARATORS))
+        except (UnicodeDecodeError, csv.Error):
+            continue
+        return encoding, dialect.delimiter
+    
+    return None
+
+
+def _read_csv_fast(csv_path: str, **kwargs) -> pd.DataFrame:
+    """Read a CSV with the multithreaded pyarrow engine.
+    
+    Falls back to the default C engine for files pyarrow rejects (e.g.,
+    malformed quoting), which it parses more leniently.
+    
+    Args:
+        csv_path: Path to CSV file
+        **kwargs: Extra arguments for pd.read_csv
+        
+    Returns:
+        Loaded DataFrame
+    """
+    try:
+        return pd.read_csv(csv_path, engine='pyarrow', **kwargs)
+    except Exception as e:
+        logger.debug("pyarrow_csv_read_failed", file=csv_path, error=str(e))
+        return pd.read_csv(csv_path, **kwargs)
+
+
+@lru_cache(maxsize=8)
+def _scan_latest_csv(folder: Path, folder_mtime_ns: int) -> Optional[str]:
+    """Return the most recent CSV in a folder, preferring non-Sync files.
+    
+    Cached on the folder's mtime, which changes whenever a file is added,
+    removed or renamed, so unchanged folders are not re-scanned.
+    
+    Args:
+        folder: Folder to scan
+        folder_mtime_ns: Folder modification time (cache key only)
+        
+    Returns:
+        Path to the latest CSV file, or None if there are none
+    """
+    best_path: Optional[str] = None
+    best_mtime = -1.0
+    # Sync exports only count when no other CSV exists
+    best_sync_path: Optional[str] = None
+    best_sync_mtime = -1.0
+    
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.') or not name.lower().endswith('.csv'):
+                continue
+            if not entry.is_file():
+                continue
+            
+            mtime = entry.stat().st_mtime
+            if 'Sync' in name:
+                if mtime > best_sync_mtime:
+                    best_sync_mtime, best_sync_path = mtime, entry.path
+            elif mtime > best_mtime:
+                best_mtime, best_path = mtime, entry.path
+    
+    return best_path or best_sync_path
+
+
+@lru_cache(maxsize=None)
+def _override_arrays() -> Tuple[np.ndarray, np.ndarray]:
+    """Build the sorted override SKU and quantity arrays once per process."""
+    return (
+        np.array(FIXED_STOCK_OVERRIDE_KEYS, dtype='U5'),
+        np.array(FIXED_STOCK_OVERRIDE_VALUES, dtype=np.int32),
+    )
+
 
 class FlexxusSync:
     """Synchronize Flexxus data with Magento.
@@ -44,11 +164,12 @@ class FlexxusSync:
             settings: Settings instance (uses global if not provided)
         """
         self.settings = settings or get_settings()
-        self.flexxus_folder = self.settings.flexxus_stock_folder
+        self.flexxus_folder = Path(self.settings.flexxus_stock_folder)
+        self.last_synced: Optional[pd.DataFrame] = None
         
         logger.debug(
             "flexxus_sync_initialized",
-            folder=self.flexxus_folder
+            folder=str(self.flexxus_folder)
         )
     
     def find_latest_csv(self) -> str:
@@ -60,36 +181,26 @@ class FlexxusSync:
         Raises:
             FileNotFoundError: If no CSV files found
         """
-        csv_pattern = os.path.join(self.flexxus_folder, "*.csv")
-        csv_files = glob.glob(csv_pattern)
+        try:
+            folder_mtime_ns = os.stat(self.flexxus_folder).st_mtime_ns
+            latest_file = _scan_latest_csv(self.flexxus_folder, folder_mtime_ns)
+        except OSError:
+            latest_file = None
         
-        if not csv_files:
+        if not latest_file:
             logger.error(
                 "no_csv_files_found",
-                folder=self.flexxus_folder
+                folder=str(self.flexxus_folder)
             )
             raise FileNotFoundError(
-                self.flexxus_folder,
+                str(self.flexxus_folder),
                 file_type="Flexxus CSV"
             )
         
-        # Filter out sync files and get modification times
-        files_with_time = []
-        for f in csv_files:
-            if 'Sync' not in os.path.basename(f):
-                files_with_time.append((f, os.path.getmtime(f)))
-        
-        if not files_with_time:
-            # If all files have 'Sync' in name, use all files
-            files_with_time = [(f, os.path.getmtime(f)) for f in csv_files]
-        
-        # Get most recent file
-        latest_file = max(files_with_time, key=lambda x: x[1])[0]
-        
         logger.info(
             "csv_file_selected",
             file=os.path.basename(latest_file),
-            folder=self.flexxus_folder
+            folder=str(self.flexxus_folder)
         )
         
         return latest_file
@@ -108,40 +219,91 @@ class FlexxusSync:
         """
         logger.info("loading_flexxus_data", file=csv_path)
         
-        # Try different encodings and separators
-        encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252', 'utf-8-sig']
-        separators = [';', ',', '\t']
-        
         df: Optional[pd.DataFrame] = None
         used_encoding = None
         used_separator = None
         
-        for encoding in encodings:
-            for sep in separators:
-                try:
-                    df = pd.read_csv(csv_path, encoding=encoding, sep=sep)
-                    if len(df.columns) >= 3:
-                        used_encoding = encoding
-                        used_separator = sep
-                        break
-                except Exception:
-                    continue
-            if df is not None and len(df.columns) >= 3:
-                break
+        # Sniff the format from the file head so the CSV is parsed only once
+        detected = _detect_csv_format(csv_path)
+        if detected:
+            try:
+                # Peek at the header to load only the required columns
+                header = pd.read_csv(
+                    csv_path, encoding=detected[0], sep=detected[1], nrows=0
+                ).columns
+                usecols = [
+                    col for col in header
+                    if str(col).lower().strip() in _REQUIRED_COLUMNS
+                ]
+                
+                df = _read_csv_fast(
+                    csv_path,
+                    encoding=detected[0],
+                    sep=detected[1],
+                    usecols=usecols if len(usecols) == len(_REQUIRED_COLUMNS) else None
+                )
+                if len(df.columns) >= 3:
+                    used_encoding, used_separator = detected
+                else:
+                    df = None
+            except Exception:
+                df = None
+        
+        # Fall back to trying every encoding and separator
+        if df is None:
+            logger.debug("csv_format_detection_failed", file=csv_path)
+            for encoding in _CSV_ENCODINGS:
+                for sep in _CSV_SEPARATORS:
+                    try:
+                        df = pd.read_csv(csv_path, encoding=encoding, sep=sep)
+                        if len(df.columns) >= 3:
+                            used_encoding = encoding
+                            used_separator = sep
+                            break
+                    except Exception:
+                        continue
+                if df is not None and len(df.columns) >= 3:
+                    break
         
         if df is None:
-            logger.error("failed_to_load_csv", tried_encodings=encodings)
+            logger.error("failed_to_load_csv", tried_encodings=_CSV_ENCODINGS)
             raise DataProcessingError(
                 "Could not load CSV with any known format",
                 operation="load_flexxus_data"
             )
         
+        df = self._clean_flexxus_frame(df)
+        
+        logger.info(
+            "flexxus_data_loaded",
+            rows=len(df),
+            encoding=used_encoding,
+            separator=used_separator,
+            qty_min=df['qty'].min(),
+            qty_max=df['qty'].max(),
+            price_min=df['price'].min(),
+            price_max=df['price'].max()
+        )
+        
+        return df
+    
+    def _clean_flexxus_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Validate and normalize raw Flexxus rows.
+        
+        Args:
+            df: DataFrame as read from the CSV
+            
+        Returns:
+            DataFrame with sku/qty/price columns and invalid SKUs removed
+            
+        Raises:
+            DataProcessingError: If required columns are missing
+        """
         # Normalize column names
         df.columns = df.columns.str.lower().str.strip()
         
         # Check required columns
-        required_cols = ['sku', 'qty', 'price']
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        missing_cols = [col for col in _REQUIRED_COLUMNS if col not in df.columns]
         
         if missing_cols:
             logger.error(
@@ -154,33 +316,69 @@ class FlexxusSync:
                 operation="load_flexxus_data"
             )
         
-        # Select and copy only required columns
-        df = df[required_cols].copy()
+        # Select only required columns (already done when usecols applied)
+        if len(df.columns) != len(_REQUIRED_COLUMNS):
+            df = df[_REQUIRED_COLUMNS].copy()
         
-        # Normalize SKUs
-        df['sku'] = df['sku'].apply(normalize_sku)
+        # Normalize SKUs; as a category, the isin filters below compare
+        # each distinct SKU once instead of every row
+        df['sku'] = normalize_sku_series(df['sku']).astype('category')
         
         # Clean numeric columns
         df['qty'] = pd.to_numeric(df['qty'], errors='coerce').fillna(0).astype(int)
         df['price'] = pd.to_numeric(df['price'], errors='coerce').fillna(0.0)
         
-        # Filter out invalid SKUs
-        df = df[df['sku'] != '']
-        df = df[df['sku'] != 'nan']
-        df = df[df['sku'] != '00000']
+        # Filter out invalid SKUs in a single pass
+        df = df[~df['sku'].isin(('', 'nan', '00000'))]
+        
+        return df
+    
+    def _load_filter_chunks(
+        self,
+        csv_path: str,
+        magento_skus: Set[str],
+        csv_format: Tuple[str, str]
+    ) -> Iterator[pd.DataFrame]:
+        """Load a large Flexxus CSV in chunks, keeping only Magento SKUs.
+        
+        Only the rows that survive the filter are kept, so memory use is
+        bounded by the chunk size rather than the file size.
+        
+        Args:
+            csv_path: Path to CSV file
+            magento_skus: Set of valid Magento SKUs
+            csv_format: (encoding, separator) of the file
+            
+        Yields:
+            Cleaned DataFrames containing only Magento SKUs
+            
+        Raises:
+            DataProcessingError: If required columns are missing
+        """
+        encoding, sep = csv_format
+        
+        header = pd.read_csv(csv_path, encoding=encoding, sep=sep, nrows=0).columns
+        usecols = [col for col in header if str(col).lower().strip() in _REQUIRED_COLUMNS]
+        
+        total_rows = 0
+        with pd.read_csv(
+            csv_path,
+            encoding=encoding,
+            sep=sep,
+            usecols=usecols if len(usecols) == len(_REQUIRED_COLUMNS) else None,
+            chunksize=_CSV_CHUNK_ROWS
+        ) as reader:
+            for chunk in reader:
+                total_rows += len(chunk)
+                chunk = self._clean_flexxus_frame(chunk)
+                yield chunk[chunk['sku'].isin(magento_skus)]
         
         logger.info(
-            "flexxus_data_loaded",
-            rows=len(df),
-            encoding=used_encoding,
-            separator=used_separator,
-            qty_min=df['qty'].min(),
-            qty_max=df['qty'].max(),
-            price_min=df['price'].min(),
-            price_max=df['price'].max()
+            "flexxus_chunks_loaded",
+            rows=total_rows,
+            encoding=encoding,
+            separator=sep
         )
-        
-        return df
     
     def filter_by_magento_skus(
         self, 
@@ -194,7 +392,8 @@ class FlexxusSync:
             magento_skus: Set of valid Magento SKUs
             
         Returns:
-            Filtered DataFrame
+            Filtered DataFrame (a new frame; not a view to be modified
+            in place)
         """
         logger.info(
             "filtering_by_magento_skus",
@@ -203,7 +402,7 @@ class FlexxusSync:
         )
         
         initial_count = len(df_flexxus)
-        df_filtered = df_flexxus[df_flexxus['sku'].isin(magento_skus)].copy()
+        df_filtered = df_flexxus[df_flexxus['sku'].isin(magento_skus)]
         final_count = len(df_filtered)
         
         logger.info(
@@ -222,25 +421,23 @@ class FlexxusSync:
             df: DataFrame with SKU and qty columns
             
         Returns:
-            DataFrame with overrides applied
+            DataFrame with overrides applied (the input is not modified,
+            but unchanged columns may share memory with it)
         """
         logger.info("applying_stock_overrides")
         
-        df = df.copy()
-        overridden_count = 0
+        override_keys, override_values = _override_arrays()
+        sku_values = df['sku'].to_numpy(dtype=str)
+        mask = np.isin(sku_values, override_keys)
+        idx = np.searchsorted(override_keys, sku_values[mask])
         
-        for sku, fixed_qty in FIXED_STOCK_OVERRIDES.items():
-            # Normalize SKU from overrides
-            normalized_sku = normalize_sku(sku)
-            
-            if normalized_sku in df['sku'].values:
-                df.loc[df['sku'] == normalized_sku, 'qty'] = fixed_qty
-                overridden_count += 1
-                logger.debug(
-                    "stock_override_applied",
-                    sku=normalized_sku,
-                    qty=fixed_qty
-                )
+        qty = df['qty'].to_numpy(copy=True)
+        qty[mask] = override_values[idx]
+        df = df.assign(qty=qty)
+        
+        overridden_skus = np.unique(sku_values[mask]).tolist()
+        overridden_count = len(overridden_skus)
+        logger.debug("stock_override_applied", skus=overridden_skus)
         
         logger.info(
             "stock_overrides_applied",
@@ -277,13 +474,11 @@ class FlexxusSync:
             output_path = os.path.join(output_dir, output_filename)
             
             # Prepare export data
+            # Prices are written with 2 decimals by to_csv's float_format
             df_export = df_synced.copy()
+            df_export['price'] = df_export['price'].astype('float64')
             df_export['special_price'] = df_export['price']
             
-            # Format prices
-            df_export['price'] = df_export['price'].apply(lambda x: f"{x:.2f}")
-            df_export['special_price'] = df_export['special_price'].apply(lambda x: f"{x:.2f}")
-            
             # Reorder columns
             cols_order = ['sku', 'qty', 'price', 'special_price']
             df_export = df_export[cols_order]
@@ -294,6 +489,7 @@ class FlexxusSync:
                 index=False,
                 sep=';',
                 encoding='utf-8-sig',
+                float_format='%.2f',
                 quoting=0  # csv.QUOTE_MINIMAL
             )
             
@@ -324,7 +520,8 @@ class FlexxusSync:
             apply_overrides: Whether to apply fixed stock overrides
             
         Returns:
-            Path to exported sync file
+            Path to exported sync file (the exported data is kept in
+            ``last_synced`` for statistics)
             
         Raises:
             DataProcessingError: If synchronization fails
@@ -333,16 +530,30 @@ class FlexxusSync:
         
         # Find and load Flexxus data
         csv_path = self.find_latest_csv()
-        df_flexxus = self.load_flexxus_data(csv_path)
         
-        if df_flexxus.empty:
-            raise DataProcessingError(
-                "No data loaded from Flexxus",
-                operation="synchronize"
-            )
-        
-        # Filter by Magento SKUs
-        df_synced = self.filter_by_magento_skus(df_flexxus, magento_skus)
+        csv_format = None
+        if os.path.getsize(csv_path) >= _CHUNKED_LOAD_MIN_BYTES:
+            csv_format = _detect_csv_format(csv_path)
+        
+        if csv_format:
+            # Large export: load and filter by Magento SKUs chunk by chunk
+            logger.info("loading_flexxus_data_in_chunks", file=csv_path)
+            chunks = list(self._load_filter_chunks(csv_path, magento_skus, csv_format))
+            df_synced = pd.concat(chunks) if chunks else pd.DataFrame(columns=_REQUIRED_COLUMNS)
+            df_synced['sku'] = df_synced['sku'].astype('category')
+        else:
+            df_flexxus = self.load_flexxus_data(csv_path)
+            
+            if df_flexxus.empty:
+                raise DataProcessingError(
+                    "No data loaded from Flexxus",
+                    operation="synchronize"
+                )
+            
+            # Filter by Magento SKUs, then release the full export so only
+            # the matching rows stay alive through overrides and export
+            df_synced = self.filter_by_magento_skus(df_flexxus, magento_skus)
+            del df_flexxus
         
         if df_synced.empty:
             logger.warning("no_matching_skus_found")
@@ -357,6 +568,7 @@ class FlexxusSync:
         
         # Export result
         output_path = self.export_synced_data(df_synced)
+        self.last_synced = df_synced
         
         logger.info(
             "synchronization_complete",
@@ -375,15 +587,15 @@ class FlexxusSync:
         Returns:
             Dictionary with statistics
         """
+        # One aggregation call instead of a pass per statistic
+        agg = df[['qty', 'price']].agg(['sum', 'mean', 'min', 'max'])
+        
         return {
             "total_skus": len(df),
-            "total_qty": int(df['qty'].sum()),
-            "avg_qty": float(df['qty'].mean()),
-            "min_price": float(df['price'].min()),
-            "max_price": float(df['price'].max()),
-            "avg_price": float(df['price'].mean()),
-            "stock_overrides_applied": len([
-                sku for sku in df['sku'] 
-                if sku in [normalize_sku(k) for k in FIXED_STOCK_OVERRIDES.keys()]
-            ])
+            "total_qty": int(agg.at['sum', 'qty']),
+            "avg_qty": float(agg.at['mean', 'qty']),
+            "min_price": float(agg.at['min', 'price']),
+            "max_price": float(agg.at['max', 'price']),
+            "avg_price": float(agg.at['mean', 'price']),
+            "stock_overrides_applied": int(df['sku'].isin(_NORMALIZED_OVERRIDE_SET).sum())
         }
@@ -4,13 +4,29 @@ This module provides the GoogleSheetsUploader class for uploading
 DataFrames to Google Sheets with proper error handling and batching.
 """
 
-from typing import Optional, Dict, List
+from functools import lru_cache
+from typing import Any, Optional, Dict, Iterable, Iterator, List, Set, Tuple
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 import gspread
+from gspread.urls import SPREADSHEET_VALUES_BATCH_UPDATE_URL
+from gspread.utils import ValueInputOption, ValueRenderOption, absolute_range_name
 from gspread.worksheet import Worksheet
 from google.oauth2.service_account import Credentials
 import structlog
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+try:
+    import orjson
+except ImportError:  # Optional: gspread's stdlib json encoding is used instead
+    orjson = None
 
 from ..config.settings import Settings, get_settings
 from ..core.exceptions import AuthenticationError, APIError, DataProcessingError
@@ -18,6 +34,147 @@ from ..core.exceptions import AuthenticationError, APIError, DataProcessingError
 logger = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _build_client(credentials_path: str, scopes: Tuple[str, ...]) -> gspread.Client:
+    """Build an authorized gspread client, once per credentials file.
+    
+    The client's session keeps reusing its access token until it expires,
+    so later uploaders in the same process skip the key file read and
+    token exchange.
+    
+    Args:
+        credentials_path: Path to the service account JSON file
+        scopes: Google API scopes to request
+        
+    Returns:
+        Authorized gspread client
+    """
+    creds = Credentials.from_service_account_file(credentials_path, scopes=list(scopes))
+    return gspread.authorize(creds)
+
+
+# Sheets API status codes worth retrying (quota exceeded and server errors)
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_MAX_API_ATTEMPTS = 6
+_MAX_RETRY_WAIT = 60.0
+
+_backoff_wait = wait_exponential_jitter(initial=1, max=_MAX_RETRY_WAIT)
+
+
+def _is_retryable_api_error(error: BaseException) -> bool:
+    """Check whether a Sheets API error is transient (429 or 5xx)."""
+    return (
+        isinstance(error, gspread.exceptions.APIError)
+        and error.response.status_code in _RETRYABLE_STATUS_CODES
+    )
+
+
+def _retry_wait(retry_state) -> float:
+    """Seconds to wait before the next attempt.
+    
+    Honors the Retry-After header sent with 429 responses and falls back
+    to exponential backoff with jitter otherwise.
+    """
+    error = retry_state.outcome.exception()
+    retry_after = error.response.headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), _MAX_RETRY_WAIT)
+    return _backoff_wait(retry_state)
+
+
+def _log_retry(retry_state) -> None:
+    """Log a retried Sheets API call."""
+    error = retry_state.outcome.exception()
+    call = retry_state.fn.__name__
+    if call == "_api_call":
+        # Report the wrapped gspread method instead of the wrapper
+        call = getattr(retry_state.args[0], "__name__", call)
+    logger.warning(
+        "sheets_api_retry",
+        call=call,
+        attempt=retry_state.attempt_number,
+        status=error.response.status_code,
+        wait=round(retry_state.next_action.sleep, 1)
+    )
+
+
+# Retries a Sheets API call on transient errors; other errors raise at once
+_sheets_retry = retry(
+    retry=retry_if_exception(_is_retryable_api_error),
+    wait=_retry_wait,
+    stop=stop_after_attempt(_MAX_API_ATTEMPTS),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
+
+# Column documentation uploaded to the "Documentacion" worksheet
+_DOCUMENTATION_COLUMNS = ["Hoja / Categoria", "Columna / Concepto", "Descripcion / Regla"]
+_DOCUMENTATION_ROWS = (
+    # --- RFM CLIENTES ---
+    ("RFM Clientes", "Name", "Nombre completo registrado en Magento."),
+    ("RFM Clientes", "Customer Email", "Correo electronico del cliente (ID principal)."),
+    ("RFM Clientes", "ID", "ID interno de la base de datos de clientes."),
+    ("RFM Clientes", "Cliente_Desde", "Fecha de creacion de la cuenta del cliente."),
+    ("RFM Clientes", "Telefono", "Numero de telefono registrado."),
+    ("RFM Clientes", "Codigo_Postal", "Codigo postal de la direccion del cliente."),
+    ("RFM Clientes", "Es_Bahia_Blanca", "Indica si el cliente es de Bahia Blanca."),
+    ("RFM Clientes", "Tax_VAT_Number", "DNI, CUIT o CUIL registrado en el campo Tax."),
+    ("RFM Clientes", "VAT_Number", "Numero de identificacion fiscal secundario."),
+    ("RFM Clientes", "Tiene_Factura_A", "Indica si el cliente tiene al menos una orden con Factura A."),
+    ("RFM Clientes", "LTV_Gasto_Total", "Life Time Value: Suma de todas las compras finalizadas."),
+    ("RFM Clientes", "Ticket_Promedio_Mensual", "Gasto estimado del cliente por cada mes de antiguedad."),
+    ("RFM Clientes", "Gasto_Promedio_Compra", "Valor promedio de cada orden realizada."),
+    ("RFM Clientes", "Gasto_Maximo_Compra", "Monto de la compra mas alta registrada."),
+    ("RFM Clientes", "Gasto_Minimo_Compra", "Monto de la compra mas baja registrada."),
+    ("RFM Clientes", "Frecuencia", "Cantidad total de ordenes aprobadas."),
+    ("RFM Clientes", "Recencia_Fecha", "Fecha de la ultima compra realizada."),
+    ("RFM Clientes", "Recencia_Dias", "Dias desde la ultima compra (menor = mas activo)."),
+    ("RFM Clientes", "Tiempo_Promedio_Entre_Compras", "Dias promedio entre pedidos."),
+    ("RFM Clientes", "Primera_Compra_Fecha", "Fecha de la primera orden registrada."),
+    ("RFM Clientes", "Dias_Como_Cliente", "Antiguedad total en dias desde la primera compra."),
+    ("RFM Clientes", "Ultimo_Trimestre_Compra", "Trimestre de actividad mas reciente."),
+    ("RFM Clientes", "Dia_Semana_Max_Frec", "Dia de la semana con mayor frecuencia de compra."),
+    ("RFM Clientes", "Categoria_Preferida", "Categoria donde el cliente tiene mas gasto."),
+    ("RFM Clientes", "Lista_Categorias_Compradas", "Todas las categorias que el cliente ha probado."),
+    ("RFM Clientes", "Marca_Preferida", "Marca que el cliente elige con mayor frecuencia."),
+    ("RFM Clientes", "Lista_Marcas_Compradas", "Listado de todas las marcas adquiridas."),
+    ("RFM Clientes", "Total_Productos_Unicos", "Cantidad de SKUs diferentes comprados."),
+    ("RFM Clientes", "Producto_Favorito_SKU", "SKU del producto mas comprado."),
+    ("RFM Clientes", "Producto_Favorito_Nombre", "Nombre del producto mas comprado."),
+    ("RFM Clientes", "Producto_Favorito_Qty", "Unidades totales del producto favorito."),
+    ("RFM Clientes", "Historial_Ordenes_Mapeo", "Detalle: ID Orden | Monto | Estado."),
+    
+    # --- CARRITOS ---
+    ("Carritos", "Email", "Email del cliente que abandono el carrito."),
+    ("Carritos", "Subtotal", "Monto de los productos olvidados en el carrito."),
+    ("Carritos", "Es_Bahia_Blanca", "Indica si el cliente es de Bahia Blanca."),
+    ("Carritos", "Tiene_Factura_A", "Indica si el cliente ha usado Factura A anteriormente."),
+    ("Carritos", "Score_Intencion", "Puntaje 0-100 de valor de recuperacion."),
+    ("Carritos", "Segmento", "Prioridad: Alta, Media o Baja."),
+    ("Carritos", "Tipo_Cliente", "Clasificacion: VIP, Recurrente, Nuevo."),
+    ("Carritos", "Accion_Sugerida", "Sugerencia de contacto (WhatsApp, Email, etc.)."),
+    
+    # --- LOGICA VIP ---
+    ("LOGICA: Clientes", "VIP", "Gasto Total > $1.000.000 O Frecuencia >= 5 O Tiene Factura A = Si."),
+    ("LOGICA: Clientes", "Recurrente", "Mas de 1 compra realizada."),
+    ("LOGICA: Clientes", "Nuevo", "0 o 1 compra realizada en total."),
+    
+    # --- LOGICA SCORING ---
+    ("LOGICA: Scoring", "Score Total", "Suma de: LTV (30) + Frecuencia (30) + Recencia (20) + Carrito (20)."),
+    ("LOGICA: Scoring", "Puntos LTV", "> 1M: 30 pts | > 300k: 20 pts | > 0: 10 pts."),
+    ("LOGICA: Scoring", "Puntos Frecuencia", ">= 5: 30 pts | >= 3: 20 pts | >= 1: 10 pts."),
+    ("LOGICA: Scoring", "Puntos Recencia", "< 7 dias: 20 pts | < 30 dias: 10 pts."),
+    ("LOGICA: Scoring", "Puntos Carrito", "> 300k: 20 pts | > 100k: 10 pts."),
+)
+
+
+@lru_cache(maxsize=1)
+def _documentation_df() -> pd.DataFrame:
+    """Build the documentation DataFrame once per process."""
+    return pd.DataFrame(list(_DOCUMENTATION_ROWS), columns=_DOCUMENTATION_COLUMNS)
+
+
 class GoogleSheetsUploader:
     """Upload data to Google Sheets.
     
@@ -31,6 +188,9 @@ class GoogleSheetsUploader:
         >>> uploader.upload_cart_data(df_carts)
     """
     
+    # Upper bound of cells per values request, to keep request bodies small
+    MAX_CELLS_PER_REQUEST = 50_000
+    
     # Google API scopes required
     SCOPES = [
         "https://www.googleapis.com/auth/spreadsheets",
@@ -69,12 +229,8 @@ class GoogleSheetsUploader:
         try:
             logger.info("connecting_to_google_sheets")
             
-            creds = Credentials.from_service_account_file(
-                self.credentials_path,
-                scopes=self.SCOPES
-            )
-            self.client = gspread.authorize(creds)
-            self.spreadsheet = self.client.open(self.spreadsheet_name)
+            self.client = _build_client(self.credentials_path, tuple(self.SCOPES))
+            self.spreadsheet = self._api_call(self.client.open, self.spreadsheet_name)
             
             logger.info(
                 "connected_to_spreadsheet",
@@ -92,6 +248,22 @@ class GoogleSheetsUploader:
                 endpoint="sheets.open"
             )
     
+    @staticmethod
+    @_sheets_retry
+    def _api_call(func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Call a gspread method, retrying on 429 and 5xx responses.
+        
+        Args:
+            func: Bound gspread method
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Whatever func returns
+        """
+        return func(*args, **kwargs)
+    
+    @_sheets_retry
     def _get_or_create_worksheet(
         self, 
         title: str, 
@@ -142,14 +314,19 @@ class GoogleSheetsUploader:
         """
         try:
             if clear_first:
-                worksheet.clear()
+                self._api_call(worksheet.clear)
                 logger.debug("worksheet_cleared", title=worksheet.title)
             
-            # Prepare data (handle NaN and convert to string)
-            data = [df.columns.tolist()] + df.fillna("").astype(str).values.tolist()
-            
-            # Upload in batch
-            worksheet.update(data)
+            # Upload in row chunks; RAW keeps numbers as numbers and skips
+            # server-side parsing of the values
+            for start_row, chunk in self._chunk_values(self._dataframe_to_values(df)):
+                self._api_call(
+                    worksheet.update,
+                    chunk,
+                    range_name=f"A{start_row}",
+                    value_input_option=ValueInputOption.raw
+                )
+                logger.debug("worksheet_chunk_uploaded", title=worksheet.title, start_row=start_row)
             
             logger.info(
                 "worksheet_updated",
@@ -169,74 +346,276 @@ class GoogleSheetsUploader:
                 operation="upload_dataframe"
             )
     
-    def _generate_documentation_df(self) -> pd.DataFrame:
-        """Generate documentation DataFrame.
+    def upload_dataframe_incremental(self, worksheet: Worksheet, df: pd.DataFrame) -> int:
+        """Upload DataFrame to a worksheet, rewriting only the rows that changed.
+        
+        The current sheet contents are read once (unformatted, so numbers
+        compare as numbers) and compared row by row with the new values.
+        Runs of changed rows are written in one values batchUpdate, and rows
+        left over from a longer previous upload are cleared. An empty sheet
+        ends up fully written, like upload_dataframe.
         
+        Args:
+            worksheet: Target worksheet
+            df: DataFrame to upload
+            
         Returns:
-            DataFrame with column documentation
+            Number of rows written
+            
+        Raises:
+            DataProcessingError: If upload fails
         """
-        docs = [
-            # --- RFM CLIENTES ---
-            ["RFM Clientes", "Name", "Nombre completo registrado en Magento."],
-            ["RFM Clientes", "Customer Email", "Correo electronico del cliente (ID principal)."],
-            ["RFM Clientes", "ID", "ID interno de la base de datos de clientes."],
-            ["RFM Clientes", "Cliente_Desde", "Fecha de creacion de la cuenta del cliente."],
-            ["RFM Clientes", "Telefono", "Numero de telefono registrado."],
-            ["RFM Clientes", "Codigo_Postal", "Codigo postal de la direccion del cliente."],
-            ["RFM Clientes", "Es_Bahia_Blanca", "Indica si el cliente es de Bahia Blanca."],
-            ["RFM Clientes", "Tax_VAT_Number", "DNI, CUIT o CUIL registrado en el campo Tax."],
-            ["RFM Clientes", "VAT_Number", "Numero de identificacion fiscal secundario."],
-            ["RFM Clientes", "Tiene_Factura_A", "Indica si el cliente tiene al menos una orden con Factura A."],
-            ["RFM Clientes", "LTV_Gasto_Total", "Life Time Value: Suma de todas las compras finalizadas."],
-            ["RFM Clientes", "Ticket_Promedio_Mensual", "Gasto estimado del cliente por cada mes de antiguedad."],
-            ["RFM Clientes", "Gasto_Promedio_Compra", "Valor promedio de cada orden realizada."],
-            ["RFM Clientes", "Gasto_Maximo_Compra", "Monto de la compra mas alta registrada."],
-            ["RFM Clientes", "Gasto_Minimo_Compra", "Monto de la compra mas baja registrada."],
-            ["RFM Clientes", "Frecuencia", "Cantidad total de ordenes aprobadas."],
-            ["RFM Clientes", "Recencia_Fecha", "Fecha de la ultima compra realizada."],
-            ["RFM Clientes", "Recencia_Dias", "Dias desde la ultima compra (menor = mas activo)."],
-            ["RFM Clientes", "Tiempo_Promedio_Entre_Compras", "Dias promedio entre pedidos."],
-            ["RFM Clientes", "Primera_Compra_Fecha", "Fecha de la primera orden registrada."],
-            ["RFM Clientes", "Dias_Como_Cliente", "Antiguedad total en dias desde la primera compra."],
-            ["RFM Clientes", "Ultimo_Trimestre_Compra", "Trimestre de actividad mas reciente."],
-            ["RFM Clientes", "Dia_Semana_Max_Frec", "Dia de la semana con mayor frecuencia de compra."],
-            ["RFM Clientes", "Categoria_Preferida", "Categoria donde el cliente tiene mas gasto."],
-            ["RFM Clientes", "Lista_Categorias_Compradas", "Todas las categorias que el cliente ha probado."],
-            ["RFM Clientes", "Marca_Preferida", "Marca que el cliente elige con mayor frecuencia."],
-            ["RFM Clientes", "Lista_Marcas_Compradas", "Listado de todas las marcas adquiridas."],
-            ["RFM Clientes", "Total_Productos_Unicos", "Cantidad de SKUs diferentes comprados."],
-            ["RFM Clientes", "Producto_Favorito_SKU", "SKU del producto mas comprado."],
-            ["RFM Clientes", "Producto_Favorito_Nombre", "Nombre del producto mas comprado."],
-            ["RFM Clientes", "Producto_Favorito_Qty", "Unidades totales del producto favorito."],
-            ["RFM Clientes", "Historial_Ordenes_Mapeo", "Detalle: ID Orden | Monto | Estado."],
+        try:
+            current = self._api_call(
+                worksheet.get_values,
+                value_render_option=ValueRenderOption.unformatted
+            )
+            values = self._dataframe_to_values(df)
+            
+            # Pad changed rows to the old width so stale trailing cells are blanked
+            width = max([len(row) for row in current] + [len(values[0])])
+            
+            def trimmed(row: List[Any]) -> List[Any]:
+                end = len(row)
+                while end and row[end - 1] == "":
+                    end -= 1
+                return row[:end]
+            
+            changed = [
+                index for index, row in enumerate(values)
+                if index >= len(current) or trimmed(row) != trimmed(current[index])
+            ]
+            
+            # Group consecutive changed rows into blocks
+            blocks: List[Tuple[int, List[List[Any]]]] = []
+            for index in changed:
+                row = values[index] + [""] * (width - len(values[index]))
+                if blocks and blocks[-1][0] + len(blocks[-1][1]) == index + 1:
+                    blocks[-1][1].append(row)
+                else:
+                    blocks.append((index + 1, [row]))
+            
+            self._upload_ranges(
+                (worksheet.title, start_row + chunk_start - 1, chunk)
+                for start_row, rows in blocks
+                for chunk_start, chunk in self._chunk_values(rows)
+            )
             
-            # --- CARRITOS ---
-            ["Carritos", "Email", "Email del cliente que abandono el carrito."],
-            ["Carritos", "Subtotal", "Monto de los productos olvidados en el carrito."],
-            ["Carritos", "Es_Bahia_Blanca", "Indica si el cliente es de Bahia Blanca."],
-            ["Carritos", "Tiene_Factura_A", "Indica si el cliente ha usado Factura A anteriormente."],
-            ["Carritos", "Score_Intencion", "Puntaje 0-100 de valor de recuperacion."],
-            ["Carritos", "Segmento", "Prioridad: Alta, Media o Baja."],
-            ["Carritos", "Tipo_Cliente", "Clasificacion: VIP, Recurrente, Nuevo."],
-            ["Carritos", "Accion_Sugerida", "Sugerencia de contacto (WhatsApp, Email, etc.)."],
+            if len(current) > len(values):
+                self._api_call(
+                    self.spreadsheet.values_batch_clear,
+                    body={"ranges": [absolute_range_name(worksheet.title, f"{len(values) + 1}:{len(current)}")]}
+                )
             
-            # --- LOGICA VIP ---
-            ["LOGICA: Clientes", "VIP", "Gasto Total > $1.000.000 O Frecuencia >= 5 O Tiene Factura A = Si."],
-            ["LOGICA: Clientes", "Recurrente", "Mas de 1 compra realizada."],
-            ["LOGICA: Clientes", "Nuevo", "0 o 1 compra realizada en total."],
+            logger.info(
+                "worksheet_updated_incrementally",
+                title=worksheet.title,
+                rows=len(df),
+                changed_rows=len(changed),
+                removed_rows=max(len(current) - len(values), 0)
+            )
+            return len(changed)
             
-            # --- LOGICA SCORING ---
-            ["LOGICA: Scoring", "Score Total", "Suma de: LTV (30) + Frecuencia (30) + Recencia (20) + Carrito (20)."],
-            ["LOGICA: Scoring", "Puntos LTV", "> 1M: 30 pts | > 300k: 20 pts | > 0: 10 pts."],
-            ["LOGICA: Scoring", "Puntos Frecuencia", ">= 5: 30 pts | >= 3: 20 pts | >= 1: 10 pts."],
-            ["LOGICA: Scoring", "Puntos Recencia", "< 7 dias: 20 pts | < 30 dias: 10 pts."],
-            ["LOGICA: Scoring", "Puntos Carrito", "> 300k: 20 pts | > 100k: 10 pts."],
-        ]
-        
-        return pd.DataFrame(
-            docs, 
-            columns=["Hoja / Categoria", "Columna / Concepto", "Descripcion / Regla"]
+        except Exception as e:
+            logger.error(
+                "worksheet_upload_failed",
+                title=worksheet.title,
+                error=str(e)
+            )
+            raise DataProcessingError(
+                f"Failed to upload to worksheet {worksheet.title}: {e}",
+                operation="upload_dataframe_incremental"
+            )
+    
+    def upload_dataframes(
+        self,
+        data: Dict[str, pd.DataFrame],
+        clear_first: bool = True,
+        existing_titles: Optional[Set[str]] = None
+    ) -> None:
+        """Upload several DataFrames, one per worksheet, in a single API call.
+        
+        Missing worksheets are created with one batchUpdate request; all of
+        them are then cleared with one batchClear request and written with
+        one values batchUpdate.
+        
+        Args:
+            data: Mapping of worksheet title to DataFrame
+            clear_first: If True, clear the worksheets before uploading
+            existing_titles: Titles already in the spreadsheet (fetched if
+                not provided)
+            
+        Raises:
+            DataProcessingError: If upload fails
+        """
+        if not self.spreadsheet:
+            raise APIError(
+                "Not connected to spreadsheet. Call connect() first.",
+                endpoint="upload_dataframes"
+            )
+        
+        if existing_titles is None:
+            existing_titles = {ws.title for ws in self._api_call(self.spreadsheet.worksheets)}
+        
+        missing_titles = [title for title in data if title not in existing_titles]
+        if missing_titles:
+            logger.info("creating_worksheets", titles=missing_titles)
+            self._api_call(self.spreadsheet.batch_update, {
+                "requests": [
+                    {
+                        "addSheet": {
+                            "properties": {
+                                "title": title,
+                                "gridProperties": {"rowCount": 2000, "columnCount": 40}
+                            }
+                        }
+                    }
+                    for title in missing_titles
+                ]
+            })
+        
+        try:
+            if clear_first:
+                self._api_call(
+                    self.spreadsheet.values_batch_clear,
+                    body={"ranges": [absolute_range_name(title) for title in data]}
+                )
+                logger.debug("worksheets_cleared", titles=list(data))
+            
+            self._upload_ranges(
+                (title, start_row, chunk)
+                for title, df in data.items()
+                for start_row, chunk in self._chunk_values(self._dataframe_to_values(df))
+            )
+            
+            logger.info(
+                "worksheets_updated",
+                titles=list(data),
+                rows=sum(len(df) for df in data.values())
+            )
+            
+        except Exception as e:
+            logger.error(
+                "worksheets_upload_failed",
+                titles=list(data),
+                error=str(e)
+            )
+            raise DataProcessingError(
+                f"Failed to upload worksheets {list(data)}: {e}",
+                operation="upload_dataframes"
+            )
+    
+    def _upload_ranges(self, ranges: Iterable[Tuple[str, int, List[List[Any]]]]) -> None:
+        """Write row blocks with as few values batchUpdate requests as possible.
+        
+        Blocks are packed into requests of at most MAX_CELLS_PER_REQUEST
+        cells.
+        
+        Args:
+            ranges: (worksheet title, 1-based start row, rows) tuples
+        """
+        batches: List[List[Dict[str, Any]]] = [[]]
+        batch_cells = 0
+        for title, start_row, rows in ranges:
+            cells = len(rows) * max(len(rows[0]), 1)
+            if batches[-1] and batch_cells + cells > self.MAX_CELLS_PER_REQUEST:
+                batches.append([])
+                batch_cells = 0
+            batches[-1].append({
+                "range": absolute_range_name(title, f"A{start_row}"),
+                "values": rows
+            })
+            batch_cells += cells
+        
+        if not batches[-1]:
+            return
+        
+        for index, batch in enumerate(batches, start=1):
+            self._values_batch_update({
+                "valueInputOption": ValueInputOption.raw,
+                "data": batch
+            })
+            logger.info("worksheets_batch_uploaded", batch=index, total=len(batches))
+    
+    @_sheets_retry
+    def _values_batch_update(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Call values batchUpdate, encoding the body with orjson if available.
+        
+        Large uploads spend most of their client-side time serializing the
+        values, which orjson does several times faster than stdlib json.
+        Transient API errors are retried with backoff.
+        
+        Args:
+            body: Values batchUpdate request body
+            
+        Returns:
+            API response body
+        """
+        if orjson is None:
+            return self.spreadsheet.values_batch_update(body=body)
+        
+        response = self.spreadsheet.client.request(
+            "post",
+            SPREADSHEET_VALUES_BATCH_UPDATE_URL % self.spreadsheet.id,
+            data=orjson.dumps(body),
+            headers={"Content-Type": "application/json"}
         )
+        return response.json()
+    
+    def _chunk_values(self, values: List[List[Any]]) -> Iterator[Tuple[int, List[List[Any]]]]:
+        """Split a values matrix into row chunks of at most MAX_CELLS_PER_REQUEST.
+        
+        Args:
+            values: Header + rows matrix
+            
+        Yields:
+            (1-based start row, rows) tuples
+        """
+        width = max(len(values[0]), 1) if values else 1
+        rows_per_chunk = max(1, self.MAX_CELLS_PER_REQUEST // width)
+        
+        for start in range(0, len(values), rows_per_chunk):
+            yield start + 1, values[start:start + rows_per_chunk]
+    
+    @staticmethod
+    def _dataframe_to_values(df: pd.DataFrame) -> List[List[Any]]:
+        """Convert a DataFrame to a header + rows matrix for the Sheets API.
+        
+        Columns are converted one at a time: numeric columns keep native
+        Python numbers (sent as JSON numbers), everything else becomes
+        strings. Missing values become empty cells.
+        
+        Args:
+            df: DataFrame to convert
+            
+        Returns:
+            List of rows, starting with the column names
+        """
+        columns = []
+        for name in df.columns:
+            col = df[name]
+            
+            if is_numeric_dtype(col) and not is_bool_dtype(col):
+                # NaN/inf are not valid JSON numbers: send them as text
+                finite = np.isfinite(col.to_numpy(dtype="float64", na_value=np.nan))
+                values = col.astype(object)
+                values = values.where(finite, values.fillna("").astype(str))
+            else:
+                values = col.astype(str).where(col.notna(), "")
+            
+            columns.append(values.tolist())
+        
+        return [df.columns.tolist()] + [list(row) for row in zip(*columns)]
+    
+    def _generate_documentation_df(self) -> pd.DataFrame:
+        """Generate documentation DataFrame.
+        
+        The frame is static, so the same (read-only) instance is reused.
+        
+        Returns:
+            DataFrame with column documentation
+        """
+        return _documentation_df()
     
     def upload_rfm_data(
         self, 
@@ -275,34 +654,29 @@ class GoogleSheetsUploader:
             
             data_to_upload["Carritos Abandonados"] = df_carts
             
-            # Create segmented cart sheets
-            for customer_type in ["Nuevo", "Recurrente", "VIP"]:
-                df_segment = df_carts[df_carts.get("Tipo_Cliente") == customer_type]
-                if not df_segment.empty:
-                    data_to_upload[f"Carritos - {customer_type}s"] = df_segment
+            # Create segmented cart sheets (one grouping pass over the carts)
+            if "Tipo_Cliente" in df_carts.columns:
+                segments = dict(list(df_carts.groupby("Tipo_Cliente", sort=False)))
+                for customer_type in ["Nuevo", "Recurrente", "VIP"]:
+                    df_segment = segments.get(customer_type)
+                    if df_segment is not None and not df_segment.empty:
+                        data_to_upload[f"Carritos - {customer_type}s"] = df_segment
         
         # Get existing worksheets
-        existing_worksheets = {ws.title: ws for ws in self.spreadsheet.worksheets()}
-        
-        # Upload all data
-        for title, df in data_to_upload.items():
-            try:
-                worksheet = self._get_or_create_worksheet(title)
-                self.upload_dataframe(worksheet, df, clear_first=True)
-                
-            except Exception as e:
-                logger.error(
-                    "upload_failed",
-                    worksheet=title,
-                    error=str(e)
-                )
-                raise
+        existing_worksheets = {ws.title: ws for ws in self._api_call(self.spreadsheet.worksheets)}
+        
+        # Upload all data in one batch
+        self.upload_dataframes(
+            data_to_upload,
+            clear_first=True,
+            existing_titles=set(existing_worksheets)
+        )
         
         # Clean up obsolete worksheets
         for old_title, ws in existing_worksheets.items():
             if old_title not in data_to_upload:
                 try:
-                    self.spreadsheet.del_worksheet(ws)
+                    self._api_call(self.spreadsheet.del_worksheet, ws)
                     logger.info("deleted_obsolete_worksheet", title=old_title)
                 except Exception as e:
                     logger.warning(
@@ -317,7 +691,8 @@ class GoogleSheetsUploader:
         self, 
         worksheet_name: str, 
         df: pd.DataFrame,
-        clear_first: bool = True
+        clear_first: bool = True,
+        incremental: bool = False
     ) -> None:
         """Simple upload to a single worksheet.
         
@@ -325,6 +700,8 @@ class GoogleSheetsUploader:
             worksheet_name: Name of the worksheet
             df: DataFrame to upload
             clear_first: If True, clear worksheet before uploading
+            incremental: If True, only rewrite the rows that differ from the
+                current sheet contents (clear_first is ignored)
         """
         if not self.spreadsheet:
             raise APIError(
@@ -333,6 +710,9 @@ class GoogleSheetsUploader:
             )
         
         worksheet = self._get_or_create_worksheet(worksheet_name)
-        self.upload_dataframe(worksheet, df, clear_first=clear_first)
+        if incremental:
+            self.upload_dataframe_incremental(worksheet, df)
+        else:
+            self.upload_dataframe(worksheet, df, clear_first=clear_first)
         
         logger.info("simple_upload_complete", worksheet=worksheet_name, rows=len(df))
@@ -4,10 +4,13 @@ This module provides the GoogleMerchantFeed class for generating
 TSV feeds compatible with Google Merchant Center.
 """
 
+import json
 import os
-from typing import Optional, List, Dict, Any
+from pathlib import Path
+from typing import Optional, Dict, List, Any
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import structlog
 
@@ -55,7 +58,8 @@ class GoogleMerchantFeed:
         categories_file_path: str,
         output_path: str,
         base_url: Optional[str] = None,
-        media_base_url: Optional[str] = None
+        media_base_url: Optional[str] = None,
+        cache_dir: Optional[str] = None
     ) -> None:
         """Initialize the merchant feed generator.
         
@@ -64,11 +68,14 @@ class GoogleMerchantFeed:
             output_path: Directory path for output TSV file
             base_url: Base URL for product links (default: giliycia.com.ar)
             media_base_url: Base URL for product images
+            cache_dir: Directory for the parsed taxonomy cache (disabled if None)
         """
         self.categories_file_path = categories_file_path
         self.output_path = output_path
         self.base_url = base_url or self.BASE_URL
         self.media_base_url = media_base_url or self.MEDIA_BASE_URL
+        self.cache_dir = cache_dir
+        self._category_index: Optional[Dict[str, str]] = None
         
         logger.debug(
             "merchant_feed_initialized",
@@ -79,6 +86,9 @@ class GoogleMerchantFeed:
     def load_google_categories(self) -> List[str]:
         """Load Google product categories taxonomy.
         
+        When ``cache_dir`` is set, the parsed list is stored there as JSON
+        and reused until the taxonomy file's mtime or size changes.
+        
         Returns:
             List of category strings
             
@@ -92,21 +102,24 @@ class GoogleMerchantFeed:
             )
             return []
         
+        stat = os.stat(self.categories_file_path)
+        cache_key = [stat.st_mtime_ns, stat.st_size]
+        
+        categories = self._load_cached_categories(cache_key)
+        if categories is not None:
+            return categories
+        
         try:
-            categories = []
-            with open(self.categories_file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    parts = line.strip().split(' - ', 1)
-                    if len(parts) > 1:
-                        categories.append(parts[1])
-                    else:
-                        categories.append(line.strip())
+            text = Path(self.categories_file_path).read_text(encoding='utf-8')
+            
+            # Lines look like "<id> - <category path>"; keep the path
+            lines = (line.strip() for line in text.splitlines())
+            categories = [line.partition(' - ')[2] or line for line in lines if line]
             
             logger.debug(
                 "categories_loaded",
                 count=len(categories)
             )
-            return categories
             
         except Exception as e:
             logger.error(
@@ -114,49 +127,185 @@ class GoogleMerchantFeed:
                 error=str(e)
             )
             return []
+        
+        self._save_cached_categories(cache_key, categories)
+        return categories
     
-    def _extract_product_data(self, row: pd.Series) -> Dict[str, Any]:
-        """Extract and format product data from DataFrame row.
+    def _categories_cache_path(self) -> Optional[Path]:
+        """Get the taxonomy cache file path, or None if caching is disabled."""
+        if not self.cache_dir:
+            return None
+        return Path(self.cache_dir) / 'google_categories.json'
+    
+    def _load_cached_categories(self, cache_key: List[int]) -> Optional[List[str]]:
+        """Load the parsed taxonomy from the disk cache if it is still valid.
         
         Args:
-            row: Product DataFrame row
+            cache_key: [mtime_ns, size] of the current taxonomy file
             
         Returns:
-            Dictionary with formatted product data
+            Cached category list or None if missing, outdated, malformed or
+            unreadable
         """
-        # Basic product info
-        sku = row.get('sku', '')
-        name = row.get('name', '')
-        brand = row.get('brand', self.DEFAULT_BRAND)
-        
-        # Handle empty brand
-        if not brand or brand == 'Sin Marca':
-            brand = self.DEFAULT_BRAND
-        
-        # Price formatting
-        price_val = row.get('price', 0)
-        price_str = f"{price_val:.2f} {self.DEFAULT_CURRENCY}".replace('.', ',')
-        
-        # Product URL
-        url_key = row.get('url_key')
-        if url_key:
-            link = f"{self.base_url}/{url_key}.html"
-        else:
-            product_id = row.get('id', '')
-            link = f"{self.base_url}/catalog/product/view/id/{product_id}"
+        cache_path = self._categories_cache_path()
+        if cache_path is None or not cache_path.exists():
+            return None
+        
+        try:
+            cached = json.loads(cache_path.read_text(encoding='utf-8'))
+            
+            if not isinstance(cached, dict):
+                raise ValueError("cache payload is not an object")
+            if cached.get('source') != str(self.categories_file_path) or cached.get('key') != cache_key:
+                logger.debug("categories_cache_stale", path=str(cache_path))
+                return None
+            
+            categories = cached.get('categories')
+            if not isinstance(categories, list) or not all(isinstance(c, str) for c in categories):
+                raise ValueError("cached categories are not a list of strings")
+        except Exception as e:
+            logger.warning("categories_cache_read_failed", path=str(cache_path), error=str(e))
+            return None
+        
+        logger.debug("categories_loaded_from_cache", path=str(cache_path), count=len(categories))
+        return categories
+    
+    def _save_cached_categories(self, cache_key: List[int], categories: List[str]) -> None:
+        """Write the parsed taxonomy to the disk cache (failures are only logged).
+        
+        Args:
+            cache_key: [mtime_ns, size] of the taxonomy file that was parsed
+            categories: Parsed category list
+        """
+        cache_path = self._categories_cache_path()
+        if cache_path is None:
+            return
+        
+        payload = {
+            'source': str(self.categories_file_path),
+            'key': cache_key,
+            'categories': categories
+        }
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(payload, ensure_ascii=False), encoding='utf-8')
+            logger.debug("categories_cache_written", path=str(cache_path))
+        except Exception as e:
+            logger.warning("categories_cache_write_failed", path=str(cache_path), error=str(e))
+    
+    def _get_category_index(self) -> Dict[str, str]:
+        """Get the taxonomy indexed by lowercase leaf name (built once).
+        
+        Returns:
+            Mapping of leaf name (e.g. "power drills") to full category path
+        """
+        if self._category_index is None:
+            index: Dict[str, str] = {}
+            for category in self.load_google_categories():
+                leaf = category.rpartition(' > ')[2].strip().lower()
+                # Keep the first (shallowest) category for repeated leaf names
+                index.setdefault(leaf, category)
+            self._category_index = index
+        return self._category_index
+    
+    def _match_google_categories(self, product_type: pd.Series) -> pd.Series:
+        """Match Magento category lists to Google taxonomy categories.
+        
+        Each Magento category name is looked up in the leaf index, so a
+        product costs one dict lookup per category it belongs to instead of
+        a scan of the whole taxonomy. Each distinct category list is only
+        matched once.
+        
+        Args:
+            product_type: Comma-separated Magento category names per product
+            
+        Returns:
+            Google category per product (DEFAULT_CATEGORY when nothing matches)
+        """
+        index = self._get_category_index()
+        
+        def match(categories: str) -> str:
+            for name in categories.split(','):
+                category = index.get(name.strip().lower())
+                if category:
+                    return category
+            return self.DEFAULT_CATEGORY
+        
+        if not index:
+            return pd.Series(self.DEFAULT_CATEGORY, index=product_type.index, dtype=object)
+        
+        product_type = product_type.fillna('').astype(str)
+        matches = {categories: match(categories) for categories in product_type.unique()}
+        return product_type.map(matches)
+    
+    def _column(self, df: pd.DataFrame, name: str, default: Any = '') -> pd.Series:
+        """Get a product column, or a constant Series if it is missing.
+        
+        Args:
+            df: Product DataFrame
+            name: Column name
+            default: Value used when the column doesn't exist
+            
+        Returns:
+            Column values aligned with df
+        """
+        if name in df.columns:
+            return df[name]
+        return pd.Series(default, index=df.index, dtype=object)
+    
+    def _build_feed_frame(
+        self,
+        products_df: pd.DataFrame,
+        smart_category: bool = False
+    ) -> pd.DataFrame:
+        """Build the Merchant Center rows for all products at once.
+        
+        Args:
+            products_df: DataFrame with product data from Magento
+            smart_category: If True, match each product's categories to the
+                Google taxonomy instead of using DEFAULT_CATEGORY
+            
+        Returns:
+            DataFrame with REQUIRED_COLUMNS, one row per product
+        """
+        def is_present(values: pd.Series) -> pd.Series:
+            return values.notna() & (values.astype(str) != '')
+        
+        # Brand, falling back to the default for empty or unknown brands
+        brand = self._column(products_df, 'brand', self.DEFAULT_BRAND)
+        brand = brand.where(is_present(brand) & (brand != 'Sin Marca'), self.DEFAULT_BRAND)
+        
+        # Price formatting (e.g., "1234,50 ARS")
+        price = pd.to_numeric(self._column(products_df, 'price', 0), errors='coerce').fillna(0)
+        price_str = (
+            price.map('{:.2f}'.format).str.replace('.', ',', regex=False)
+            + f" {self.DEFAULT_CURRENCY}"
+        )
+        
+        # Product URL, by url_key when available
+        url_key = self._column(products_df, 'url_key', None)
+        product_id = self._column(products_df, 'id')
+        link = np.where(
+            is_present(url_key),
+            self.base_url + '/' + url_key.astype(str) + '.html',
+            self.base_url + '/catalog/product/view/id/' + product_id.astype(str)
+        )
         
         # Image URL
-        image_path = row.get('image', '')
-        image_link = f"{self.media_base_url}{image_path}" if image_path else ""
+        image = self._column(products_df, 'image')
+        image_link = np.where(is_present(image), self.media_base_url + image.astype(str), '')
         
-        # Category - currently using fixed category for performance
-        # TODO: Implement smart category matching if needed
-        google_category = self.DEFAULT_CATEGORY
-        product_type = row.get('categories', '')
+        # Category - fixed unless smart matching is requested
+        product_type = self._column(products_df, 'categories')
+        if smart_category:
+            google_category = self._match_google_categories(product_type)
+        else:
+            google_category = self.DEFAULT_CATEGORY
         
-        return {
-            'id': sku,
-            'title': name,
+        return pd.DataFrame({
+            'id': self._column(products_df, 'sku'),
+            'title': self._column(products_df, 'name'),
             'description': self.DEFAULT_DESCRIPTION,
             'link': link,
             'image_link': image_link,
@@ -166,13 +315,15 @@ class GoogleMerchantFeed:
             'google_product_category': google_category,
             'product_type': product_type,
             'condition': self.DEFAULT_CONDITION
-        }
+        }, index=products_df.index)
     
-    def generate(self, products_df: pd.DataFrame) -> str:
+    def generate(self, products_df: pd.DataFrame, smart_category: bool = False) -> str:
         """Generate Google Merchant Center TSV file.
         
         Args:
             products_df: DataFrame with product data from Magento
+            smart_category: If True, match product categories to the Google
+                taxonomy (otherwise every product gets DEFAULT_CATEGORY)
             
         Returns:
             Path to generated TSV file
@@ -204,57 +355,17 @@ class GoogleMerchantFeed:
             product_count=len(products_df)
         )
         
-        # Load categories (for logging purposes)
-        google_categories = self.load_google_categories()
-        if google_categories:
-            logger.info(
-                "google_categories_loaded",
-                count=len(google_categories)
-            )
-        
-        # Process products
-        merchant_rows = []
-        total = len(products_df)
-        
-        for index, row in products_df.iterrows():
-            try:
-                product_data = self._extract_product_data(row)
-                merchant_rows.append(product_data)
-                
-                # Log progress every 500 items
-                if (index + 1) % 500 == 0:
-                    logger.info(
-                        "processing_progress",
-                        processed=index + 1,
-                        total=total,
-                        percentage=f"{(index + 1) / total * 100:.1f}%"
-                    )
-                    
-            except Exception as e:
-                logger.error(
-                    "failed_to_process_product",
-                    index=index,
-                    sku=row.get('sku', 'unknown'),
-                    error=str(e)
+        # The taxonomy is only needed for category matching
+        if smart_category:
+            category_index = self._get_category_index()
+            if category_index:
+                logger.info(
+                    "google_categories_loaded",
+                    count=len(category_index)
                 )
-                continue
-        
-        # Create DataFrame
-        df_merchant = pd.DataFrame(merchant_rows)
-        
-        if df_merchant.empty:
-            raise DataProcessingError(
-                "No products could be processed",
-                operation="generate"
-            )
-        
-        # Ensure all required columns exist
-        for col in self.REQUIRED_COLUMNS:
-            if col not in df_merchant.columns:
-                df_merchant[col] = ''
         
-        # Reorder columns
-        df_merchant = df_merchant[self.REQUIRED_COLUMNS]
+        # Build all feed rows with column operations
+        df_merchant = self._build_feed_frame(products_df, smart_category=smart_category)
         
         # Generate filename with timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -5,21 +5,192 @@ eliminating code duplication across the application and providing consistent
 error handling, retry logic, and authentication.
 """
 
-from typing import Any, Dict, Iterator, Optional, Union
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import structlog
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to requests' stdlib json decoding
+    orjson = None
+
 from ..config.settings import Settings, get_settings
-from ..config.constants import USER_AGENT, OrderStatus
+from ..config.constants import (
+    BULK_CHUNK_SIZE,
+    CACHE_TTL,
+    LOOKUP_CACHE_TTL,
+    PAGE_SIZE_BY_ENDPOINT,
+    TOKEN_CACHE_TTL,
+    USER_AGENT,
+    OrderStatus,
+)
 from ..core.exceptions import APIError, AuthenticationError, ValidationError
 
 logger = structlog.get_logger(__name__)
 
+# Lookup maps shared by all clients: (base_url, name) -> (fetched_at, mapping)
+_LOOKUP_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, str]]] = {}
+
+# One lock per lookup, so concurrent callers wait for a single fetch
+_LOOKUP_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
+
+
+# Records converted to Arrow per batch when building DataFrames
+RECORD_BATCH_ROWS = 10_000
+
+# Parquet schema metadata key holding the owner of the cached catalog
+CATALOG_CACHE_OWNER_KEY = b"gili_cache_owner"
+
+
+def _records_to_frame(records: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+    """Build a DataFrame from flat records, converting them in Arrow batches.
+    
+    Only RECORD_BATCH_ROWS dicts are alive at a time; each batch becomes a
+    columnar Arrow table, so building a large frame doesn't need the full
+    list of dicts in memory. Columns that are empty in some batches are
+    promoted to the type seen in the others.
+    
+    Args:
+        records: Flat dicts (one per row), e.g. a processing generator
+        
+    Returns:
+        DataFrame with one row per record
+    """
+    records = iter(records)
+    tables = []
+    pending: Iterable[Dict[str, Any]] = ()
+    
+    try:
+        for batch in iter(lambda: list(islice(records, RECORD_BATCH_ROWS)), []):
+            pending = batch
+            columns = dict.fromkeys(key for row in batch for key in row)
+            tables.append(pa.table({col: [row.get(col) for row in batch] for col in columns}))
+            pending = ()
+        if not tables:
+            return pd.DataFrame()
+        return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # A column mixes value types: let pandas build object columns
+        converted = (row for table in tables for row in table.to_pylist())
+        return pd.DataFrame(chain(converted, pending, records))
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when available.
+    
+    Args:
+        response: HTTP response
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+class _AdaptiveLimiter:
+    """AIMD limit on the number of concurrent requests to the server.
+    
+    The limit grows by about one request per window of successful
+    responses and is halved (at most once per DECREASE_INTERVAL) when the
+    server throttles with 429/503, so workers back off before their
+    retries run out instead of only after.
+    """
+    
+    DECREASE_INTERVAL = 1.0
+    
+    def __init__(self, max_limit: int) -> None:
+        """Initialize the limiter.
+        
+        Args:
+            max_limit: Upper bound (and starting value) of the limit
+        """
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+    
+    def acquire(self) -> None:
+        """Wait until a request slot is free and take it."""
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+    
+    def release(self, success: bool) -> None:
+        """Free a request slot.
+        
+        Args:
+            success: If True, additively raise the limit
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if success and self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+    
+    def throttle(self) -> None:
+        """Halve the limit after a throttling response."""
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.DECREASE_INTERVAL:
+                self.limit = max(1.0, self.limit / 2)
+                self._last_decrease = now
+                logger.info("api_concurrency_reduced", limit=int(self.limit))
+
+
+class _JitteredRetry(Retry):
+    """Retry policy with "full jitter" exponential backoff.
+    
+    Each wait is a random fraction of the capped exponential delay, so
+    clients that fail at the same time don't retry in lockstep.
+    Retry-After headers are still honored by urllib3 before this applies.
+    Throttling responses (429/503) are reported to ``on_throttle``.
+    """
+    
+    BACKOFF_CAP = 15.0
+    THROTTLE_STATUSES = frozenset({429, 503})
+    
+    on_throttle: Optional[Any] = None
+    
+    def new(self, **kw: Any) -> "_JitteredRetry":
+        """Copy the policy for the next attempt, keeping the throttle callback."""
+        retry = super().new(**kw)
+        retry.on_throttle = self.on_throttle
+        return retry
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        """Record a failed attempt, reporting throttling responses first."""
+        if self.on_throttle and response is not None and response.status in self.THROTTLE_STATUSES:
+            self.on_throttle()
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+    
+    def get_backoff_time(self) -> float:
+        """Return a random delay between 0 and the capped exponential backoff."""
+        return random.random() * min(super().get_backoff_time(), self.BACKOFF_CAP)
+
 
 class MagentoAPIClient:
     """Unified client for Magento REST API.
@@ -47,25 +218,65 @@ class MagentoAPIClient:
             settings: Settings instance (uses global if not provided)
         """
         self.settings = settings or get_settings()
-        self.token: Optional[str] = None
+        self._token: Optional[str] = None
         self.base_url = f"{self.settings.magento_url}/rest/V1"
+        self._catalog: Optional[pd.DataFrame] = None
+        
+        # Serializes token fetches, so concurrent workers log in only once
+        self._auth_lock = threading.RLock()
         
         # Configure session with retry logic
         self.session = requests.Session()
-        retry_strategy = Retry(
+        retry_strategy = _JitteredRetry(
             total=self.settings.api_retries,
-            backoff_factor=1,
+            backoff_factor=0.25,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        
+        # Concurrency limit that shrinks when the server throttles
+        self._limiter = _AdaptiveLimiter(self.settings.api_concurrency)
+        retry_strategy.on_throttle = self._limiter.throttle
+        
+        # Keep one pooled connection per concurrent request so keep-alive
+        # connections are reused instead of re-opened
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(10, self.settings.api_concurrency),
+            max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
+        # Headers shared by every request; Authorization is added by the
+        # token setter
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Content-Type": "application/json"
+        })
+        
         logger.debug("api_client_initialized", base_url=self.base_url)
     
-    def authenticate(self) -> str:
+    @property
+    def token(self) -> Optional[str]:
+        """Current admin token (None if not authenticated)."""
+        return self._token
+    
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        """Set the admin token and the session's Authorization header."""
+        self._token = value
+        if value:
+            self.session.headers["Authorization"] = f"Bearer {value}"
+        else:
+            self.session.headers.pop("Authorization", None)
+    
+    def authenticate(self, force: bool = False) -> str:
         """Authenticate with Magento API and obtain token.
         
+        Args:
+            force: If True, log in again even if a token is available (the
+                current token stays in use until the new one arrives)
+        
         Returns:
             Authentication token string
             
@@ -73,74 +284,143 @@ class MagentoAPIClient:
             AuthenticationError: If authentication fails
             APIError: If there's a connection or API error
         """
-        if self.token:
-            return self.token
+        with self._auth_lock:
+            if self.token and not force:
+                return self.token
+            
+            cached_token = None if force else self._load_cached_token()
+            if cached_token:
+                self.token = cached_token
+                return self.token
+            
+            auth_url = f"{self.settings.magento_url}/rest/V1/integration/admin/token"
+            payload = {
+                "username": self.settings.magento_user,
+                "password": self.settings.magento_password
+            }
+            
+            logger.info("authenticating", username=self.settings.magento_user)
+            
+            try:
+                response = self.session.post(
+                    auth_url,
+                    json=payload,
+                    # Don't send the token being replaced
+                    headers={"Authorization": None},
+                    timeout=self.settings.api_timeout
+                )
+                response.raise_for_status()
+                
+                self.token = _parse_json(response)
+                logger.info("authentication_successful")
+                self._save_cached_token(self.token)
+                return self.token
+                
+            except requests.exceptions.HTTPError as e:
+                if response.status_code == 401:
+                    raise AuthenticationError(
+                        "Invalid credentials",
+                        service="Magento"
+                    )
+                raise APIError(
+                    f"Authentication failed: {e}",
+                    status_code=response.status_code,
+                    endpoint="/integration/admin/token"
+                )
+            except requests.exceptions.RequestException as e:
+                raise APIError(
+                    f"Connection error during authentication: {e}",
+                    endpoint="/integration/admin/token"
+                )
+            except ValueError as e:
+                raise APIError(
+                    f"Invalid authentication response: {e}",
+                    status_code=response.status_code,
+                    endpoint="/integration/admin/token"
+                )
+    
+    def _cache_owner(self) -> str:
+        """Identify the store and user a disk cache entry belongs to."""
+        return f"{self.settings.magento_user}@{self.settings.magento_url}"
+    
+    def _load_cached_token(self) -> Optional[str]:
+        """Load the admin token from the disk cache if it is still valid.
+        
+        Returns:
+            Cached token or None if missing, expired, for another user or
+            unreadable
+        """
+        cache_path = Path(self.settings.token_cache_path)
         
-        auth_url = f"{self.settings.magento_url}/rest/V1/integration/admin/token"
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        
+        if cached.get("owner") != self._cache_owner() or cached.get("expires_at", 0) <= time.time():
+            return None
+        
+        logger.info("token_loaded_from_cache")
+        return cached.get("token")
+    
+    def _save_cached_token(self, token: str) -> None:
+        """Write the admin token to the disk cache (failures are only logged).
+        
+        Args:
+            token: Admin token
+        """
+        cache_path = Path(self.settings.token_cache_path)
         payload = {
-            "username": self.settings.magento_user,
-            "password": self.settings.magento_password
+            "owner": self._cache_owner(),
+            "token": token,
+            "expires_at": time.time() + TOKEN_CACHE_TTL
         }
         
-        logger.info("authenticating", username=self.settings.magento_user)
-        
         try:
-            response = self.session.post(
-                auth_url,
-                json=payload,
-                timeout=self.settings.api_timeout,
-                headers={"User-Agent": USER_AGENT}
-            )
-            response.raise_for_status()
-            
-            self.token = response.json()
-            logger.info("authentication_successful")
-            return self.token
-            
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 401:
-                raise AuthenticationError(
-                    "Invalid credentials",
-                    service="Magento"
-                )
-            raise APIError(
-                f"Authentication failed: {e}",
-                status_code=response.status_code,
-                endpoint="/integration/admin/token"
-            )
-        except requests.exceptions.RequestException as e:
-            raise APIError(
-                f"Connection error during authentication: {e}",
-                endpoint="/integration/admin/token"
-            )
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Create the file owner-only so the token is never readable by others
+            fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(payload))
+            # Tighten a file left over with wider permissions
+            os.chmod(cache_path, 0o600)
+        except OSError as e:
+            logger.warning("token_cache_write_failed", path=str(cache_path), error=str(e))
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with authentication.
+    def _discard_cached_token(self) -> None:
+        """Delete the token disk cache."""
+        try:
+            Path(self.settings.token_cache_path).unlink()
+        except OSError:
+            pass
+    
+    def _require_token(self) -> str:
+        """Get the current token, failing if not authenticated.
+        
+        The session already sends it in the Authorization header, so
+        requests don't build per-call header dicts.
         
         Returns:
-            Dictionary of HTTP headers
+            Admin token
             
         Raises:
             AuthenticationError: If not authenticated
         """
-        if not self.token:
+        token = self.token
+        if not token:
             raise AuthenticationError(
                 "Not authenticated. Call authenticate() first.",
                 service="Magento"
             )
-        
-        return {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-            "User-Agent": USER_AGENT
-        }
+        return token
     
     def _make_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
-        json_data: Optional[Dict] = None
+        json_data: Optional[Dict] = None,
+        retry_auth: bool = True
     ) -> Dict[str, Any]:
         """Make an authenticated API request.
         
@@ -149,6 +429,8 @@ class MagentoAPIClient:
             endpoint: API endpoint path (without base URL)
             params: Query parameters
             json_data: JSON payload for POST/PUT
+            retry_auth: If True, re-authenticate once when the token is
+                rejected (e.g. an expired cached token)
             
         Returns:
             Parsed JSON response
@@ -157,7 +439,7 @@ class MagentoAPIClient:
             APIError: If the request fails
         """
         url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
+        rejected_token = self._require_token()
         
         logger.debug(
             "api_request",
@@ -167,18 +449,31 @@ class MagentoAPIClient:
         )
         
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json_data,
-                timeout=self.settings.api_timeout
-            )
+            self._limiter.acquire()
+            success = False
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    timeout=self.settings.api_timeout
+                )
+                success = response.ok
+            finally:
+                self._limiter.release(success)
             response.raise_for_status()
-            return response.json()
+            return _parse_json(response)
             
         except requests.exceptions.HTTPError as e:
+            if response.status_code == 401 and retry_auth:
+                logger.info("token_rejected_reauthenticating", endpoint=endpoint)
+                with self._auth_lock:
+                    # Another worker may have already replaced the token
+                    if self.token == rejected_token:
+                        self._discard_cached_token()
+                        self.authenticate(force=True)
+                return self._make_request(method, endpoint, params, json_data, retry_auth=False)
             raise APIError(
                 f"API request failed: {e}",
                 status_code=response.status_code,
@@ -189,6 +484,31 @@ class MagentoAPIClient:
                 f"Connection error: {e}",
                 endpoint=endpoint
             )
+        except ValueError as e:
+            raise APIError(
+                f"Invalid JSON response: {e}",
+                status_code=response.status_code,
+                endpoint=endpoint
+            )
+    
+    def _resolve_page_size(self, endpoint: str, page_size: Optional[int] = None) -> int:
+        """Pick the page size for a paginated request.
+        
+        An explicit page_size wins, then a page size configured in the
+        environment, then the endpoint default in PAGE_SIZE_BY_ENDPOINT.
+        
+        Args:
+            endpoint: API endpoint path
+            page_size: Page size requested by the caller
+            
+        Returns:
+            Items per page
+        """
+        if page_size:
+            return page_size
+        if "page_size" in self.settings.model_fields_set:
+            return self.settings.page_size
+        return PAGE_SIZE_BY_ENDPOINT.get(endpoint, self.settings.page_size)
     
     def _paginate(
         self,
@@ -201,14 +521,14 @@ class MagentoAPIClient:
         
         Args:
             endpoint: API endpoint path
-            page_size: Items per page (uses settings default if not specified)
+            page_size: Items per page (endpoint or settings default if not specified)
             params: Additional query parameters
             desc: Description for progress bar
             
         Yields:
             Individual items from all pages
         """
-        page_size = page_size or self.settings.page_size
+        page_size = self._resolve_page_size(endpoint, page_size)
         current_page = 1
         
         request_params = {
@@ -232,39 +552,70 @@ class MagentoAPIClient:
         for item in first_items:
             yield item
         
+        # total_count tells how many pages there are, so no request is
+        # spent on a trailing empty page
+        num_pages = math.ceil(total_count / page_size)
+        
         # If only one page, we're done
-        if len(first_items) < page_size or len(first_items) >= total_count:
+        if len(first_items) < page_size or num_pages <= 1:
             logger.info("pagination_complete", endpoint=endpoint, total_items=len(first_items))
             return
         
-        # Continue with remaining pages using progress bar
-        current_page = 2
+        # Fetch the remaining pages concurrently, with a progress bar
         pbar = tqdm(total=total_count, initial=len(first_items), desc=desc, unit=" items")
         
         try:
-            while True:
-                request_params["searchCriteria[currentPage]"] = current_page
-                
-                response = self._make_request("GET", endpoint, params=request_params)
-                items = response.get("items", [])
-                
-                if not items:
-                    break
+            for items in self._fetch_pages(endpoint, request_params, range(2, num_pages + 1)):
+                yield from items
+                pbar.update(len(items))
                 
-                for item in items:
-                    yield item
-                    pbar.update(1)
-                
-                # Check if we've fetched all items
+                # A short page means the data shrank while paginating
                 if len(items) < page_size:
                     break
-                
-                current_page += 1
         finally:
             pbar.close()
         
         logger.info("pagination_complete", endpoint=endpoint, total_items=total_count)
     
+    def _fetch_pages(
+        self,
+        endpoint: str,
+        request_params: Dict[str, Any],
+        pages: range
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Fetch pages concurrently and yield their items in page order.
+        
+        Up to ``api_concurrency`` requests are in flight at once, sharing the
+        session's connection pool. Pages are requested as earlier ones are
+        consumed, so at most that many pages are held in memory.
+        
+        Args:
+            endpoint: API endpoint path
+            request_params: Query parameters (currentPage is set per page)
+            pages: Page numbers to fetch
+            
+        Yields:
+            List of items of each page
+        """
+        def fetch_page(page: int) -> List[Dict[str, Any]]:
+            page_params = {**request_params, "searchCriteria[currentPage]": page}
+            return self._make_request("GET", endpoint, params=page_params).get("items", [])
+        
+        page_iter = iter(pages)
+        workers = max(1, min(self.settings.api_concurrency, len(pages)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        
+        try:
+            pending = deque(executor.submit(fetch_page, page) for page in islice(page_iter, workers))
+            while pending:
+                items = pending.popleft().result()
+                for page in islice(page_iter, 1):
+                    pending.append(executor.submit(fetch_page, page))
+                yield items
+        finally:
+            # Don't start pages nobody will read (error or early stop)
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def _extract_payment_title(self, order: Dict[str, Any]) -> str:
         """Extract payment method title from order, including Factura A detection.
         
@@ -369,10 +720,11 @@ class MagentoAPIClient:
         
         logger.info("fetching_orders", min_year=min_year, status=status)
         
-        # Fetch and process orders
-        orders_raw = list(self._paginate("/orders", params=params, desc="Descargando ordenes"))
-        orders_processed = [self._process_order(order) for order in tqdm(orders_raw, desc="Procesando ordenes", unit=" ordenes")]
-        df = pd.DataFrame(orders_processed)
+        # Process orders as the pages arrive (raw orders are not kept)
+        df = _records_to_frame(
+            self._process_order(order)
+            for order in self._paginate("/orders", params=params, desc="Descargando ordenes")
+        )
         
         logger.info("orders_fetched", count=len(df))
         return df
@@ -397,19 +749,20 @@ class MagentoAPIClient:
             "searchCriteria[filterGroups][0][filters][0][conditionType]": "gteq",
             "searchCriteria[filterGroups][1][filters][0][field]": "status",
             "searchCriteria[filterGroups][1][filters][0][value]": OrderStatus.PROCESSING,
-            "searchCriteria[filterGroups][1][filters][0][conditionType]": "eq"
+            "searchCriteria[filterGroups][1][filters][0][conditionType]": "eq",
+            # Only return the fields _process_order_items reads
+            "fields": (
+                "items[increment_id,customer_email,"
+                "items[sku,product_type,parent_item_id,qty_invoiced,qty_ordered,row_total_incl_tax]],"
+                "total_count"
+            )
         }
         
         logger.info("fetching_order_items", min_year=min_year)
         
-        # Fetch orders with full item details
-        orders_raw = list(self._paginate("/orders", params=params, desc="Descargando ordenes con items"))
-        
-        items_data = []
-        for order in tqdm(orders_raw, desc="Procesando items", unit=" ordenes"):
-            items_data.extend(self._process_order_items(order))
-        
-        df = pd.DataFrame(items_data)
+        # Fetch orders with full item details, processing them as they arrive
+        orders = self._paginate("/orders", params=params, desc="Descargando ordenes con items")
+        df = _records_to_frame(chain.from_iterable(self._process_order_items(order) for order in orders))
         logger.info("order_items_fetched", count=len(df))
         return df
     
@@ -421,54 +774,106 @@ class MagentoAPIClient:
         """
         logger.info("fetching_customers")
         
-        customers = list(self._paginate("/customers/search", desc="Descargando clientes"))
-        df = pd.DataFrame(customers)
+        df = pd.DataFrame(self._paginate("/customers/search", desc="Descargando clientes"))
         
         logger.info("customers_fetched", count=len(df))
         return df
     
+    def _get_cached_lookup(self, name: str) -> Optional[Dict[str, str]]:
+        """Get a lookup map fetched less than LOOKUP_CACHE_TTL seconds ago.
+        
+        Args:
+            name: Lookup name (e.g. "categories", "attribute:brand")
+            
+        Returns:
+            Cached mapping (shared, don't modify) or None
+        """
+        cached = _LOOKUP_CACHE.get((self.base_url, name))
+        if cached and time.monotonic() - cached[0] < LOOKUP_CACHE_TTL:
+            return cached[1]
+        return None
+    
+    def _lookup_lock(self, name: str) -> threading.Lock:
+        """Get the lock that serializes fetches of a lookup map.
+        
+        Args:
+            name: Lookup name
+            
+        Returns:
+            Lock shared by all clients for this store and lookup
+        """
+        # dict.setdefault is atomic, so two threads always get the same lock
+        return _LOOKUP_LOCKS.setdefault((self.base_url, name), threading.Lock())
+    
+    def _set_cached_lookup(self, name: str, mapping: Dict[str, str]) -> None:
+        """Store a successfully fetched lookup map.
+        
+        Args:
+            name: Lookup name
+            mapping: Fetched mapping
+        """
+        _LOOKUP_CACHE[(self.base_url, name)] = (time.monotonic(), mapping)
+    
     def _fetch_categories_map(self) -> Dict[str, str]:
         """Fetch category ID to name mapping.
         
+        The mapping is cached in-process for LOOKUP_CACHE_TTL seconds.
+        
         Returns:
             Dictionary mapping category ID to category name
         """
-        try:
-            response = self._make_request("GET", "/categories")
-            categories = response.get("children_data", [])
-            cat_map = {}
+        with self._lookup_lock("categories"):
+            cached = self._get_cached_lookup("categories")
+            if cached is not None:
+                return cached
             
-            def extract_categories(cats):
-                for cat in cats:
+            try:
+                response = self._make_request("GET", "/categories")
+                cat_map = {}
+                
+                # Walk the category tree with an explicit stack (no recursion)
+                stack = list(response.get("children_data", []))
+                while stack:
+                    cat = stack.pop()
                     cat_id = str(cat.get("id"))
-                    cat_name = cat.get("name", cat_id)
-                    cat_map[cat_id] = cat_name
-                    if "children_data" in cat and cat["children_data"]:
-                        extract_categories(cat["children_data"])
-            
-            extract_categories(categories)
-            logger.debug("categories_map_fetched", count=len(cat_map))
-            return cat_map
-        except Exception as e:
-            logger.warning("failed_to_fetch_categories", error=str(e))
-            return {}
+                    cat_map[cat_id] = cat.get("name", cat_id)
+                    children = cat.get("children_data")
+                    if children:
+                        stack.extend(children)
+                
+                logger.debug("categories_map_fetched", count=len(cat_map))
+                self._set_cached_lookup("categories", cat_map)
+                return cat_map
+            except Exception as e:
+                logger.warning("failed_to_fetch_categories", error=str(e))
+                return {}
     
     def _fetch_attribute_options(self, attribute_code: str) -> Dict[str, str]:
         """Fetch attribute options (like brand) mapping.
         
+        The mapping is cached in-process for LOOKUP_CACHE_TTL seconds.
+        
         Args:
             attribute_code: Attribute code to fetch options for
             
         Returns:
             Dictionary mapping option value to label
         """
-        try:
-            response = self._make_request("GET", f"/products/attributes/{attribute_code}")
-            options = response.get("options", [])
-            return {opt.get("value", "").strip(): opt.get("label", "") for opt in options}
-        except Exception as e:
-            logger.warning("failed_to_fetch_attribute", attribute=attribute_code, error=str(e))
-            return {}
+        cache_name = f"attribute:{attribute_code}"
+        with self._lookup_lock(cache_name):
+            cached = self._get_cached_lookup(cache_name)
+            if cached is not None:
+                return cached
+            
+            try:
+                response = self._make_request("GET", f"/products/attributes/{attribute_code}")
+                options = response.get("options", [])
+                option_map = {opt.get("value", "").strip(): opt.get("label", "") for opt in options}
+                self._set_cached_lookup(cache_name, option_map)
+                return option_map
+            except Exception as e:
+                logger.warning("failed_to_fetch_attribute", attribute=attribute_code, error=str(e))
+                return {}
     
     def _process_product(self, item: Dict[str, Any], cat_map: Dict[str, str], brand_map: Dict[str, str]) -> Dict[str, Any]:
         """Process a single product and extract relevant fields.
@@ -481,34 +886,28 @@ class MagentoAPIClient:
         Returns:
             Processed product dictionary
         """
-        cat_string = "Sin Categoria"
+        # Index custom_attributes by code once, then look up what's needed
+        attrs = {
+            attr.get("attribute_code"): attr.get("value")
+            for attr in item.get("custom_attributes", ())
+        }
+        
+        category_ids = attrs.get("category_ids")
+        if isinstance(category_ids, str):
+            category_ids = category_ids.split(",")
+        if isinstance(category_ids, list) and category_ids:
+            cat_string = ", ".join(cat_map.get(str(i), str(i)) for i in category_ids)
+        else:
+            cat_string = "Sin Categoria"
+        
         brand_name = "Sin Marca"
-        url_key = ""
-        image = ""
+        brand_value = attrs.get("brand")
+        if brand_value:
+            brand_value_str = str(brand_value).strip()
+            brand_name = brand_map.get(brand_value_str, f"Sin Marca (ID: {brand_value_str})")
         
-        # Extract from custom_attributes
-        for attr in item.get("custom_attributes", []):
-            attr_code = attr.get("attribute_code")
-            attr_value = attr.get("value")
-            
-            if attr_code == "category_ids":
-                if isinstance(attr_value, list):
-                    cat_names = [cat_map.get(str(i), str(i)) for i in attr_value]
-                elif isinstance(attr_value, str):
-                    cat_names = [cat_map.get(str(i), str(i)) for i in attr_value.split(",")]
-                else:
-                    cat_names = []
-                cat_string = ", ".join(cat_names) if cat_names else "Sin Categoria"
-                
-            elif attr_code == "brand":
-                if attr_value:
-                    brand_value_str = str(attr_value).strip()
-                    brand_name = brand_map.get(brand_value_str, f"Sin Marca (ID: {brand_value_str})")
-            
-            elif attr_code == "url_key":
-                url_key = attr_value or ""
-            elif attr_code == "image":
-                image = attr_value or ""
+        url_key = attrs.get("url_key") or ""
+        image = attrs.get("image") or ""
         
         return {
             "id": item.get("id"),
@@ -522,33 +921,98 @@ class MagentoAPIClient:
             "image": image
         }
     
-    def fetch_catalog(self) -> pd.DataFrame:
+    def fetch_catalog(self, use_cache: bool = True) -> pd.DataFrame:
         """Fetch product catalog from Magento API.
         
         Processes products to extract categories, brand, and product_name
-        from custom_attributes.
+        from custom_attributes. The result is kept in memory for this client
+        and on disk (``catalog_cache_path``) for ``CACHE_TTL`` seconds, so
+        later calls and later commands skip the API.
+        
+        Args:
+            use_cache: If False, always fetch from the API (cache is refreshed)
         
         Returns:
             DataFrame with processed product data
         """
+        if use_cache:
+            if self._catalog is None:
+                self._catalog = self._load_cached_catalog()
+            if self._catalog is not None:
+                return self._catalog.copy()
+        
         logger.info("fetching_catalog")
         
         # Fetch mappings first
         cat_map = self._fetch_categories_map()
         brand_map = self._fetch_attribute_options("brand")
         
-        # Fetch and process products
-        products_raw = list(self._paginate("/products", desc="Descargando productos"))
-        products_processed = [
-            self._process_product(item, cat_map, brand_map) 
-            for item in tqdm(products_raw, desc="Procesando productos", unit=" items")
-        ]
-        
-        df = pd.DataFrame(products_processed)
+        # Fetch and process products as the pages arrive
+        df = _records_to_frame(
+            self._process_product(item, cat_map, brand_map)
+            for item in self._paginate("/products", desc="Descargando productos")
+        )
         
         logger.info("catalog_fetched", count=len(df))
+        
+        self._catalog = df
+        self._save_cached_catalog(df)
+        return df.copy()
+    
+    def _load_cached_catalog(self) -> Optional[pd.DataFrame]:
+        """Load the catalog from the disk cache if it is still fresh.
+        
+        Returns:
+            Cached catalog DataFrame or None if missing, stale, for another
+            store or user, or unreadable
+        """
+        cache_path = Path(self.settings.catalog_cache_path)
+        
+        try:
+            age = time.time() - os.path.getmtime(cache_path)
+        except OSError:
+            return None
+        
+        if age > CACHE_TTL:
+            logger.debug("catalog_cache_stale", path=str(cache_path), age=int(age))
+            return None
+        
+        try:
+            metadata = pq.read_schema(cache_path).metadata or {}
+            if metadata.get(CATALOG_CACHE_OWNER_KEY, b"").decode() != self._cache_owner():
+                logger.debug("catalog_cache_owner_mismatch", path=str(cache_path))
+                return None
+            df = pd.read_parquet(cache_path, engine="pyarrow")
+        except Exception as e:
+            logger.warning("catalog_cache_read_failed", path=str(cache_path), error=str(e))
+            return None
+        
+        logger.info("catalog_loaded_from_cache", path=str(cache_path), count=len(df))
         return df
     
+    def _save_cached_catalog(self, df: pd.DataFrame) -> None:
+        """Write the catalog to the disk cache (failures are only logged).
+        
+        The store and user it was fetched for are stored in the Parquet
+        schema metadata so another store's catalog is never served.
+        
+        Args:
+            df: Processed catalog DataFrame
+        """
+        cache_path = Path(self.settings.catalog_cache_path)
+        
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                CATALOG_CACHE_OWNER_KEY: self._cache_owner().encode()
+            })
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, cache_path, compression="zstd")
+            logger.debug("catalog_cache_written", path=str(cache_path))
+        except Exception as e:
+            logger.warning("catalog_cache_write_failed", path=str(cache_path), error=str(e))
+    
     def fetch_product_by_sku(self, sku: str) -> Optional[Dict[str, Any]]:
         """Fetch a single product by SKU.
         
@@ -851,6 +1315,47 @@ class MagentoAPIClient:
             logger.error("price_update_failed", sku=sku, error=str(e))
             return False
     
+    def _run_concurrently(self, func: Any, calls: List[tuple]) -> List[Any]:
+        """Run independent API calls on a thread pool.
+        
+        Args:
+            func: Client method to call
+            calls: Positional argument tuples, one per call
+            
+        Returns:
+            Results in the same order as calls
+        """
+        if not calls:
+            return []
+        
+        workers = min(self.settings.api_concurrency, len(calls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda args: func(*args), calls))
+    
+    def update_products_stock(self, stock: Dict[str, int]) -> Dict[str, bool]:
+        """Update the stock of several products concurrently.
+        
+        Args:
+            stock: Mapping of SKU to new stock quantity
+            
+        Returns:
+            Mapping of SKU to success flag
+        """
+        results = self._run_concurrently(self.update_product_stock, list(stock.items()))
+        return dict(zip(stock, results))
+    
+    def update_products_price(self, prices: Dict[str, float]) -> Dict[str, bool]:
+        """Update the price of several products concurrently.
+        
+        Args:
+            prices: Mapping of SKU to new price
+            
+        Returns:
+            Mapping of SKU to success flag
+        """
+        results = self._run_concurrently(self.update_product_price, list(prices.items()))
+        return dict(zip(prices, results))
+    
     # =========================================================================
     # Helper methods for operations module
     # =========================================================================
@@ -913,8 +1418,14 @@ class MagentoAPIClient:
                 }
             }
             
-            headers = self._get_headers()
-            response = self.session.put(url, json=data, headers=headers, timeout=30)
+            self._require_token()
+            self._limiter.acquire()
+            success = False
+            try:
+                response = self.session.put(url, json=data, timeout=30)
+                success = response.ok
+            finally:
+                self._limiter.release(success)
             response.raise_for_status()
             
             logger.debug("short_description_updated", sku=sku, store=store_view)
@@ -924,92 +1435,136 @@ class MagentoAPIClient:
             logger.debug("short_description_update_failed", sku=sku, store=store_view, error=str(e))
             return False
     
-    def get_brand_map(self) -> Dict[str, str]:
-        """Get mapping of brand IDs to brand names.
+    def update_products_short_description(
+        self,
+        skus: List[str],
+        description: str,
+        store_view: str = "all"
+    ) -> Dict[str, bool]:
+        """Update the short description of several products concurrently.
         
+        Args:
+            skus: Product SKUs
+            description: HTML content for short description
+            store_view: Store view code (default: "all")
+            
         Returns:
-            Dictionary mapping brand_id -> brand_name
+            Mapping of SKU to success flag
         """
-        try:
-            endpoint = "/products/attributes/brand/options"
-            response = self._make_request("GET", endpoint)
-            options = response if isinstance(response, list) else response.get("items", [])
-            
-            brand_map = {}
-            for opt in options:
-                if opt.get("value") and opt.get("label"):
-                    brand_map[str(opt["value"])] = opt["label"]
-            
-            logger.info("brand_map_fetched", count=len(brand_map))
-            return brand_map
-            
-        except APIError as e:
-            logger.error("failed_to_fetch_brand_map", error=str(e))
-            return {}
+        results = self._run_concurrently(
+            self.update_product_short_description,
+            [(sku, description, store_view) for sku in skus]
+        )
+        return dict(zip(skus, results))
     
-    def _paginate_request(
+    def bulk_update_short_description(
         self,
-        endpoint: str,
-        page_size: Optional[int] = None,
-        params: Optional[Dict] = None,
-        desc: str = "Procesando"
-    ) -> Iterator[Dict[str, Any]]:
-        """Make paginated request and yield items.
+        skus: List[str],
+        description: str,
+        store_view: str = "all"
+    ) -> Dict[str, bool]:
+        """Queue short description updates through Magento's async bulk API.
+        
+        SKUs are sent in chunks of BULK_CHUNK_SIZE operations per request to
+        /rest/{store}/async/bulk/V1/products/bySku. Magento applies them
+        later via its async.operations.all consumer, so a True flag means
+        the operation was accepted, not yet applied.
         
         Args:
-            endpoint: API endpoint path
-            page_size: Items per page
-            params: Additional query parameters
-            desc: Description for progress bar
+            skus: Product SKUs
+            description: HTML content for short description
+            store_view: Store view code (default: "all")
             
-        Yields:
-            Individual items from all pages
+        Returns:
+            Mapping of SKU to accepted flag
         """
-        page_size = page_size or self.settings.page_size
-        current_page = 1
-        
-        request_params = {
-            "searchCriteria[pageSize]": page_size,
-            "searchCriteria[currentPage]": current_page
-        }
-        if params:
-            request_params.update(params)
-        
-        first_response = self._make_request("GET", endpoint, params=request_params)
-        first_items = first_response.get("items", [])
-        total_count = first_response.get("total_count", len(first_items))
-        
-        if not first_items:
-            return
-        
-        for item in first_items:
-            yield item
+        url = f"{self.settings.magento_url}/rest/{store_view}/async/bulk/V1/products/bySku"
+        accepted: Dict[str, bool] = {}
+        
+        for start in range(0, len(skus), BULK_CHUNK_SIZE):
+            chunk = skus[start:start + BULK_CHUNK_SIZE]
+            data = [
+                {
+                    "product": {
+                        "sku": sku,
+                        "custom_attributes": [
+                            {
+                                "attribute_code": "short_description",
+                                "value": description
+                            }
+                        ]
+                    }
+                }
+                for sku in chunk
+            ]
+            
+            try:
+                self._require_token()
+                self._limiter.acquire()
+                success = False
+                try:
+                    response = self.session.put(url, json=data, timeout=self.settings.api_timeout)
+                    success = response.ok
+                finally:
+                    self._limiter.release(success)
+                response.raise_for_status()
+                
+                body = _parse_json(response)
+                statuses = {
+                    item.get("id"): item.get("status") == "accepted"
+                    for item in body.get("request_items", [])
+                }
+                for i, sku in enumerate(chunk):
+                    accepted[sku] = statuses.get(i, False)
+                
+                logger.debug(
+                    "bulk_short_description_queued",
+                    store=store_view,
+                    bulk_uuid=body.get("bulk_uuid"),
+                    count=len(chunk)
+                )
+                
+            except Exception as e:
+                logger.warning(
+                    "bulk_short_description_failed",
+                    store=store_view,
+                    count=len(chunk),
+                    error=str(e)
+                )
+                accepted.update(dict.fromkeys(chunk, False))
         
-        if len(first_items) < page_size or len(first_items) >= total_count:
-            return
+        return accepted
+    
+    def get_brand_map(self) -> Dict[str, str]:
+        """Get mapping of brand IDs to brand names.
         
-        current_page = 2
-        pbar = tqdm(total=total_count, initial=len(first_items), desc=desc, unit=" items")
+        The mapping is cached in-process for LOOKUP_CACHE_TTL seconds.
         
-        try:
-            while True:
-                request_params["searchCriteria[currentPage]"] = current_page
-                response = self._make_request("GET", endpoint, params=request_params)
-                items = response.get("items", [])
-                
-                if not items:
-                    break
+        Returns:
+            Dictionary mapping brand_id -> brand_name
+        """
+        with self._lookup_lock("brand_options"):
+            cached = self._get_cached_lookup("brand_options")
+            if cached is not None:
+                return cached
+            
+            try:
+                endpoint = "/products/attributes/brand/options"
+                response = self._make_request("GET", endpoint)
+                options = response if isinstance(response, list) else response.get("items", [])
                 
-                for item in items:
-                    yield item
-                    pbar.update(1)
+                brand_map = {}
+                for opt in options:
+                    if opt.get("value") and opt.get("label"):
+                        brand_map[str(opt["value"])] = opt["label"]
                 
-                if len(items) < page_size:
-                    break
+                logger.info("brand_map_fetched", count=len(brand_map))
+                self._set_cached_lookup("brand_options", brand_map)
+                return brand_map
                 
-                current_page += 1
-        finally:
-            pbar.close()
+            except APIError as e:
+                logger.error("failed_to_fetch_brand_map", error=str(e))
+                return {}
     
     def get_products_by_date_range(
         self,
@@ -1027,8 +1582,6 @@ class MagentoAPIClient:
         Yields:
             Product dictionaries
         """
-        page_size = page_size or self.settings.page_size
-        
         params = {
             "searchCriteria[filter_groups][0][filters][0][field]": "created_at",
             "searchCriteria[filter_groups][0][filters][0][value]": start_date,
@@ -1040,7 +1593,7 @@ class MagentoAPIClient:
         
         logger.info("fetching_products_by_date_range", start=start_date, end=end_date)
         
-        yield from self._paginate_request(
+        yield from self._paginate(
             "/products",
             page_size=page_size,
             params=params,
@@ -1061,8 +1614,6 @@ class MagentoAPIClient:
         Yields:
             Product dictionaries
         """
-        page_size = page_size or self.settings.page_size
-        
         params = {
             "searchCriteria[filter_groups][0][filters][0][field]": "category_id",
             "searchCriteria[filter_groups][0][filters][0][value]": category_id,
@@ -1071,7 +1622,7 @@ class MagentoAPIClient:
         
         logger.info("fetching_products_by_category", category_id=category_id)
         
-        yield from self._paginate_request(
+        yield from self._paginate(
             "/products",
             page_size=page_size,
             params=params,
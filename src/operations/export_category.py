@@ -1,7 +1,9 @@
 """Export Category Operation - Exportar productos de categoría a CSV."""
 
+import csv
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional
 from pathlib import Path
 import pandas as pd
 import structlog
@@ -11,18 +13,21 @@ from ..config.settings import Settings
 
 logger = structlog.get_logger(__name__)
 
+CSV_COLUMNS = ["sku", "articulo", "marca", "habilitado", "url-key"]
+PREVIEW_ROWS = 10
 
-def get_custom_attribute(product: Dict, attribute_code: str) -> str:
-    """Get value of a custom attribute from product."""
-    for attr in product.get("custom_attributes", []):
-        if attr.get("attribute_code") == attribute_code:
-            return attr.get("value", "") or ""
-    return ""
+
+def _index_attrs(product: Dict) -> Dict:
+    """Map attribute_code to value for the product's custom attributes."""
+    return {
+        attr.get("attribute_code"): attr.get("value")
+        for attr in product.get("custom_attributes", [])
+    }
 
 
-def get_brand_from_product(product: Dict, brand_map: Dict[str, str]) -> str:
-    """Extract brand name from product."""
-    brand_id = str(get_custom_attribute(product, "brand"))
+def get_brand_from_product(attrs: Dict, brand_map: Dict[str, str]) -> str:
+    """Extract brand name from indexed product attributes."""
+    brand_id = str(attrs.get("brand") or "")
     if brand_id:
         return brand_map.get(brand_id, "")
     return ""
@@ -34,26 +39,22 @@ def get_product_status(product: Dict) -> str:
     return "true" if status == 1 else "false"
 
 
-def generate_csv(products: List[Dict], brand_map: Dict[str, str]) -> pd.DataFrame:
-    """Generate CSV data from products."""
-    csv_data = []
-    
+def iter_csv_rows(products: Iterable[Dict], brand_map: Dict[str, str]) -> Iterator[Dict]:
+    """Yield one CSV row per product without materializing the export."""
     for product in products:
-        sku = product.get("sku", "")
-        name = product.get("name", "")
-        brand = get_brand_from_product(product, brand_map)
-        status = get_product_status(product)
-        url_key = get_custom_attribute(product, "url_key")
-        
-        csv_data.append({
-            "sku": sku,
-            "articulo": name,
-            "marca": brand,
-            "habilitado": status,
-            "url-key": url_key
-        })
-    
-    return pd.DataFrame(csv_data)
+        attrs = _index_attrs(product)
+        yield {
+            "sku": product.get("sku", ""),
+            "articulo": product.get("name", ""),
+            "marca": get_brand_from_product(attrs, brand_map),
+            "habilitado": get_product_status(product),
+            "url-key": attrs.get("url_key") or ""
+        }
+
+
+def generate_csv(products: List[Dict], brand_map: Dict[str, str]) -> pd.DataFrame:
+    """Generate CSV data from products as a DataFrame."""
+    return pd.DataFrame(list(iter_csv_rows(products, brand_map)), columns=CSV_COLUMNS)
 
 
 def run_export_category(
@@ -79,33 +80,45 @@ def run_export_category(
     brand_map = client.get_brand_map()
     logger.info("brands_fetched", count=len(brand_map))
     
-    products = list(client.get_products_by_category(category_id))
-    logger.info("products_fetched", count=len(products))
+    products = client.get_products_by_category(category_id)
+    first_product = next(products, None)
     
-    if not products:
+    if first_product is None:
+        logger.info("products_fetched", count=0)
         return {
             "success": True,
             "message": f"No se encontraron productos en la categoría {category_id}",
             "products_count": 0
         }
     
-    df = generate_csv(products, brand_map)
-    
     if output_path is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = f"productos_categoria_{category_id}_{timestamp}.csv"
     
     output_file = Path(output_path)
-    df.to_csv(output_file, index=False, encoding="utf-8-sig")
+    products_count = 0
+    preview = []
+    
+    # Rows are written as pages arrive instead of building a DataFrame
+    with open(output_file, "w", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        
+        for row in iter_csv_rows(chain([first_product], products), brand_map):
+            writer.writerow(row)
+            products_count += 1
+            if len(preview) < PREVIEW_ROWS:
+                preview.append(row)
     
+    logger.info("products_fetched", count=products_count)
     logger.info("csv_saved", path=str(output_file))
     
     result = {
         "success": True,
         "category_id": category_id,
-        "products_count": len(products),
+        "products_count": products_count,
         "output_path": str(output_file),
-        "csv_data": df.head(10).to_dict("records")
+        "csv_data": preview
     }
     
     logger.info("export_category_completed", **result)
@@ -1,6 +1,5 @@
 """Manual Update Operation - Actualización masiva de descripciones cortas."""
 
-import time
 from typing import List, Dict, Optional
 from tqdm import tqdm
 import structlog
@@ -13,23 +12,26 @@ logger = structlog.get_logger(__name__)
 DEFAULT_HTML = '''<p><a title="Recomendaciones para la colocación de pisos" href="https://drive.google.com/file/d/1u6OW9ErzEI5On8F_KigUj0wRYSZhBsar/view" target="_blank" rel="noopener"> <span style="color: #de0b0b;"> <strong> Hacé clic y accedé a nuestro manual de recomendaciones </strong> <img src="https://giliycia.com.ar/media/wysiwyg/Servicios/pdf_icon.png" alt="" /> </span> </a></p>'''
 
 
-def get_short_description(product: Dict) -> str:
-    """Extract short description from product custom attributes."""
-    for attr in product.get("custom_attributes", []):
-        if attr.get("attribute_code") == "short_description":
-            return attr.get("value", "").strip() or ""
-    return ""
+def _index_attrs(product: Dict) -> Dict:
+    """Map attribute_code to value for the product's custom attributes."""
+    return {
+        attr.get("attribute_code"): attr.get("value")
+        for attr in product.get("custom_attributes", [])
+    }
+
+
+def get_short_description(attrs: Dict) -> str:
+    """Extract short description from indexed product attributes."""
+    return (attrs.get("short_description") or "").strip()
 
 
-def has_category(product: Dict, category_id: int) -> bool:
-    """Check if product has specific category."""
-    for attr in product.get("custom_attributes", []):
-        if attr.get("attribute_code") == "category_ids":
-            category_ids = attr.get("value", [])
-            if isinstance(category_ids, list):
-                return str(category_id) in [str(c) for c in category_ids]
-            elif isinstance(category_ids, str):
-                return str(category_id) in category_ids.split(",")
+def has_category(attrs: Dict, category_id: int) -> bool:
+    """Check if indexed product attributes include a specific category."""
+    category_ids = attrs.get("category_ids", [])
+    if isinstance(category_ids, list):
+        return str(category_id) in [str(c) for c in category_ids]
+    elif isinstance(category_ids, str):
+        return str(category_id) in category_ids.split(",")
     return False
 
 
@@ -37,7 +39,8 @@ def run_manual_update(
     settings: Settings,
     category_id: int = 737,
     html_content: Optional[str] = None,
-    dry_run: bool = True
+    dry_run: bool = True,
+    bulk: bool = False
 ) -> Dict:
     """Execute manual update operation for products without short description.
     
@@ -46,6 +49,8 @@ def run_manual_update(
         category_id: Category ID to process (default: 737 - Pisos y revestimientos)
         html_content: HTML content to inject (uses default if None)
         dry_run: If True, only preview without applying changes
+        bulk: If True, queue the updates through Magento's async bulk API
+            (applied later by the async.operations.all consumer)
         
     Returns:
         Dictionary with operation results
@@ -68,12 +73,13 @@ def run_manual_update(
     
     products_to_update = []
     for product in products:
-        if not has_category(product, category_id):
+        attrs = _index_attrs(product)
+        if not has_category(attrs, category_id):
             continue
         
         sku = product.get("sku")
         name = product.get("name")
-        short_desc = get_short_description(product)
+        short_desc = get_short_description(attrs)
         
         if not short_desc:
             products_to_update.append({
@@ -105,36 +111,41 @@ def run_manual_update(
     
     logger.info("updating_stores", stores=stores_to_update)
     
+    # Each store view is updated for all products concurrently (or queued in
+    # bulk chunks); the client's adaptive limiter paces the requests.
+    failed_stores: Dict[str, List[str]] = {product["sku"]: [] for product in products_to_update}
+    skus = list(failed_stores)
+    update = (
+        client.bulk_update_short_description if bulk
+        else client.update_products_short_description
+    )
+    
+    for store_code in tqdm(stores_to_update, desc="Actualizando store views"):
+        results = update(skus, html_content, store_code)
+        for sku, ok in results.items():
+            if not ok:
+                failed_stores[sku].append(store_code)
+    
     success_count = 0
     error_count = 0
     errors_detail = []
     
-    for product in tqdm(products_to_update, desc="Actualizando productos"):
+    for product in products_to_update:
         sku = product["sku"]
-        product_success = True
-        failed_stores = []
-        
-        for store_code in stores_to_update:
-            if not client.update_product_short_description(sku, html_content, store_code):
-                product_success = False
-                failed_stores.append(store_code)
-            time.sleep(0.05)
-        
-        if product_success:
-            success_count += 1
-        else:
+        if failed_stores[sku]:
             error_count += 1
             errors_detail.append({
                 "sku": sku,
                 "name": product["name"],
-                "failed_stores": failed_stores
+                "failed_stores": failed_stores[sku]
             })
-        
-        time.sleep(0.1)
+        else:
+            success_count += 1
     
     result = {
         "success": error_count == 0,
         "dry_run": False,
+        "bulk": bulk,
         "total_products_in_category": len(products),
         "products_updated": success_count,
         "products_failed": error_count,
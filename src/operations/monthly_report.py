@@ -1,6 +1,7 @@
 """Monthly Report Operation - Reporte mensual de productos cargados."""
 
 import calendar
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
@@ -8,6 +9,7 @@ import pandas as pd
 import structlog
 
 from ..core.client import MagentoAPIClient
+from ..core.exceptions import ValidationError
 from ..config.settings import Settings
 
 logger = structlog.get_logger(__name__)
@@ -16,61 +18,60 @@ OBJ_PRODUCTOS = 240
 OBJ_UPSELLING = 240
 OBJ_CROSSSELLING = 240
 
+REPORT_FORMATS = ("xlsx", "parquet", "feather")
 
-def get_brand_from_product(product: Dict, brand_map: Dict[str, str]) -> str:
-    """Extract brand name from product."""
-    for attr in product.get("custom_attributes", []):
-        if attr.get("attribute_code") == "brand":
-            brand_id = str(attr.get("value", ""))
-            if brand_id:
-                return brand_map.get(brand_id, "Sin marca")
+
+def _index_attrs(product: Dict) -> Dict:
+    """Map attribute_code to value for the product's custom attributes."""
+    return {
+        attr.get("attribute_code"): attr.get("value")
+        for attr in product.get("custom_attributes", [])
+    }
+
+
+def get_brand_from_product(attrs: Dict, brand_map: Dict[str, str]) -> str:
+    """Extract brand name from indexed product attributes."""
+    brand_id = str(attrs.get("brand") or "")
+    if brand_id:
+        return brand_map.get(brand_id, "Sin marca")
     return "Sin marca"
 
 
 def count_product_links(product: Dict) -> tuple:
     """Count crosssell and upsell links from product."""
-    product_links = product.get("product_links", [])
-    crosssell = sum(1 for link in product_links if link.get("link_type") == "crosssell")
-    upsell = sum(1 for link in product_links if link.get("link_type") == "upsell")
-    return crosssell, upsell
+    link_types = Counter(link.get("link_type") for link in product.get("product_links", []))
+    return link_types["crosssell"], link_types["upsell"]
 
 
 def generate_report(products: List[Dict], brand_map: Dict[str, str]) -> pd.DataFrame:
-    """Generate the monthly report DataFrame."""
-    report_data = []
+    """Generate the monthly report DataFrame.
+    
+    Totals are accumulated per brand while iterating, so only the final
+    per-brand table is turned into a DataFrame.
+    """
+    if not products:
+        return pd.DataFrame()
+    
+    productos: Counter = Counter()
+    crossselling: Counter = Counter()
+    upselling: Counter = Counter()
     
     for product in products:
-        brand = get_brand_from_product(product, brand_map)
+        brand = get_brand_from_product(_index_attrs(product), brand_map)
         crosssell, upsell = count_product_links(product)
         
-        report_data.append({
-            "Marca": brand,
-            "Productos": 1,
-            "Crossselling": crosssell,
-            "Upselling": upsell
-        })
-    
-    df = pd.DataFrame(report_data)
-    
-    if df.empty:
-        return df
-    
-    df_grouped = df.groupby("Marca", as_index=False).agg({
-        "Productos": "sum",
-        "Crossselling": "sum",
-        "Upselling": "sum"
-    })
+        productos[brand] += 1
+        crossselling[brand] += crosssell
+        upselling[brand] += upsell
     
-    df_grouped = df_grouped.sort_values("Marca")
+    brands = sorted(productos)
     
-    total_row = pd.DataFrame([{
-        "Marca": "Total",
-        "Productos": df_grouped["Productos"].sum(),
-        "Crossselling": df_grouped["Crossselling"].sum(),
-        "Upselling": df_grouped["Upselling"].sum()
-    }])
-    
-    return pd.concat([df_grouped, total_row], ignore_index=True)
+    return pd.DataFrame({
+        "Marca": brands + ["Total"],
+        "Productos": [productos[b] for b in brands] + [sum(productos.values())],
+        "Crossselling": [crossselling[b] for b in brands] + [sum(crossselling.values())],
+        "Upselling": [upselling[b] for b in brands] + [sum(upselling.values())]
+    })
 
 
 def generate_summary(df_report: pd.DataFrame) -> pd.DataFrame:
@@ -117,7 +118,8 @@ def run_monthly_report(
     settings: Settings,
     year: int,
     month: int,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    output_format: str = "xlsx"
 ) -> Dict:
     """Execute monthly report operation.
     
@@ -126,10 +128,20 @@ def run_monthly_report(
         year: Report year
         month: Report month (1-12)
         output_path: Optional output file path (auto-generated if None)
+        output_format: "xlsx" for a workbook with both sheets, or "parquet"
+            / "feather" for programmatic consumers (the summary is written
+            next to the report as <name>_resumen.<ext>)
         
     Returns:
         Dictionary with operation results and report data
     """
+    if output_format not in REPORT_FORMATS:
+        raise ValidationError(
+            f"Formato no soportado: {output_format} (opciones: {', '.join(REPORT_FORMATS)})",
+            field="output_format",
+            value=output_format
+        )
+    
     month_name = calendar.month_name[month]
     logger.info("monthly_report_started", year=year, month=month, month_name=month_name)
     
@@ -159,18 +171,28 @@ def run_monthly_report(
     df_summary = generate_summary(df_report)
     
     if output_path is None:
-        output_path = f"reporte_productos_{year}_{month:02d}_{month_name}.xlsx"
+        output_path = f"reporte_productos_{year}_{month:02d}_{month_name}.{output_format}"
     
     output_file = Path(output_path)
+    summary_file = None
     
     try:
-        with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
-            df_report.to_excel(writer, sheet_name="Carga de productos", index=False, startrow=1)
-            writer.sheets["Carga de productos"]["A1"] = "Carga de productos"
-            
-            df_summary.to_excel(writer, sheet_name="Resumen", index=False)
+        if output_format == "xlsx":
+            with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
+                df_report.to_excel(writer, sheet_name="Carga de productos", index=False, startrow=1)
+                writer.sheets["Carga de productos"]["A1"] = "Carga de productos"
+                
+                df_summary.to_excel(writer, sheet_name="Resumen", index=False)
+        else:
+            summary_file = output_file.with_name(f"{output_file.stem}_resumen{output_file.suffix}")
+            if output_format == "parquet":
+                df_report.to_parquet(output_file, index=False, compression="zstd")
+                df_summary.to_parquet(summary_file, index=False, compression="zstd")
+            else:
+                df_report.to_feather(output_file, compression="zstd")
+                df_summary.to_feather(summary_file, compression="zstd")
         
-        logger.info("report_saved", path=str(output_file))
+        logger.info("report_saved", path=str(output_file), format=output_format)
     except Exception as e:
         logger.error("report_save_failed", error=str(e))
         return {
@@ -186,6 +208,7 @@ def run_monthly_report(
         "month_name": month_name,
         "products_count": len(products),
         "output_path": str(output_file),
+        "summary_path": str(summary_file) if summary_file else None,
         "report_data": df_report.to_dict("records") if not df_report.empty else [],
         "summary_data": df_summary.to_dict("records") if not df_summary.empty else []
     }
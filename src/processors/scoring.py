@@ -144,11 +144,12 @@ class MarketingScorer:
         self.strategy = strategy or DefaultScoringStrategy()
         logger.info("marketing_scorer_initialized")
     
-    def score(self, df: pd.DataFrame) -> pd.DataFrame:
+    def score(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """Calculate scores for all customers.
         
         Args:
             df: Customer DataFrame
+            copy: If False, add the column to ``df`` in place
             
         Returns:
             DataFrame with added Score_Intencion column
@@ -159,7 +160,8 @@ class MarketingScorer:
         try:
             logger.info("calculating_scores", rows=len(df))
             
-            df = df.copy()
+            if copy:
+                df = df.copy()
             df["Score_Intencion"] = df.apply(self.strategy.calculate, axis=1)
             
             logger.info("scores_calculated")
@@ -172,11 +174,12 @@ class MarketingScorer:
                 operation="score"
             )
     
-    def segment(self, df: pd.DataFrame) -> pd.DataFrame:
+    def segment(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """Add segment classification based on score.
         
         Args:
             df: DataFrame with Score_Intencion column
+            copy: If False, add the column to ``df`` in place
             
         Returns:
             DataFrame with added Segmento column
@@ -190,17 +193,19 @@ class MarketingScorer:
                 return "Media"
             return "Baja"
         
-        df = df.copy()
+        if copy:
+            df = df.copy()
         df["Segmento"] = df["Score_Intencion"].apply(get_segment)
         
         logger.debug("segmentation_complete")
         return df
     
-    def add_recommendations(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_recommendations(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """Add action recommendations based on segment.
         
         Args:
             df: DataFrame with Segmento column
+            copy: If False, add the column to ``df`` in place
             
         Returns:
             DataFrame with added Accion_Sugerida column
@@ -215,19 +220,21 @@ class MarketingScorer:
             }
             return actions.get(segment, "Automatización suave")
         
-        df = df.copy()
+        if copy:
+            df = df.copy()
         df["Accion_Sugerida"] = df["Segmento"].apply(get_action)
         
         logger.debug("recommendations_added")
         return df
     
-    def classify_customers(self, df: pd.DataFrame) -> pd.DataFrame:
+    def classify_customers(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """Classify customers as VIP, Recurrent, or New.
         
         Customers with Invoice A are automatically classified as VIP.
         
         Args:
             df: Customer DataFrame
+            copy: If False, add the column to ``df`` in place
             
         Returns:
             DataFrame with added Tipo_Cliente column
@@ -250,7 +257,8 @@ class MarketingScorer:
                 return "Recurrente"
             return "Nuevo"
         
-        df = df.copy()
+        if copy:
+            df = df.copy()
         df["Tipo_Cliente"] = df.apply(get_customer_type, axis=1)
         
         logger.debug("classification_complete")
@@ -273,10 +281,11 @@ class MarketingScorer:
         """
         logger.info("starting_marketing_scoring_pipeline")
         
+        # Copy the input once; each step then adds its column in place
         df = self.score(df)
-        df = self.segment(df)
-        df = self.add_recommendations(df)
-        df = self.classify_customers(df)
+        df = self.segment(df, copy=False)
+        df = self.add_recommendations(df, copy=False)
+        df = self.classify_customers(df, copy=False)
         
         logger.info("marketing_scoring_pipeline_complete")
         return df
@@ -2,8 +2,10 @@
 
 from .helpers import (
     normalize_sku,
+    normalize_sku_series,
     get_custom_attribute,
     parse_comma_decimal,
+    parse_comma_decimal_series,
     format_currency,
     clean_email,
     parse_date,
@@ -18,8 +20,10 @@ from .logging import setup_file_logging, get_logger
 
 __all__ = [
     "normalize_sku",
+    "normalize_sku_series",
     "get_custom_attribute",
     "parse_comma_decimal",
+    "parse_comma_decimal_series",
     "format_currency",
     "clean_email",
     "parse_date",
@@ -125,6 +125,27 @@ def normalize_sku(sku: Union[str, float, None]) -> str:
     return sku_str
 
 
+def normalize_sku_series(skus: pd.Series) -> pd.Series:
+    """Vectorized version of normalize_sku for a whole Series.
+    
+    Args:
+        skus: Series of SKU values (strings, numbers, or missing)
+        
+    Returns:
+        Series of normalized SKU strings (missing values become "")
+        
+    Examples:
+        >>> normalize_sku_series(pd.Series(["123", " 12 34 ", None])).tolist()
+        ['00123', '01234', '']
+    """
+    cleaned = skus.astype(str).str.strip().str.replace(" ", "", regex=False)
+    
+    # Only numeric SKUs are zero-padded
+    cleaned = cleaned.where(~cleaned.str.isdigit(), cleaned.str.zfill(5))
+    
+    return cleaned.where(skus.notna(), "")
+
+
 def get_custom_attribute(product: Dict[str, Any], attribute_code: str) -> str:
     """Extract a custom attribute value from a Magento product.
     
@@ -206,6 +227,48 @@ def parse_comma_decimal(value: Union[str, float, None]) -> float:
         return 0.0
 
 
+def parse_comma_decimal_series(values: pd.Series) -> pd.Series:
+    """Vectorized version of parse_comma_decimal for a whole Series.
+    
+    Values that already parse as plain numbers are kept as-is; the rest are
+    read in Argentine format ("1.234,56"). Anything unparseable becomes 0.0.
+    
+    Args:
+        values: Series of strings or numbers to parse
+        
+    Returns:
+        float64 Series with the parsed values
+        
+    Examples:
+        >>> parse_comma_decimal_series(pd.Series(["1.234,56", 7.5, None])).tolist()
+        [1234.56, 7.5, 0.0]
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype("float64").fillna(0.0)
+    
+    result = pd.Series(0.0, index=values.index, dtype="float64")
+    
+    # Only parse present values, and only rewrite the ones that fail directly
+    present = values.notna()
+    if not present.any():
+        return result
+    
+    value_str = values[present].astype(str).str.strip()
+    parsed = pd.to_numeric(value_str, errors="coerce").astype("float64")
+    
+    pending = parsed.isna()
+    if pending.any():
+        parsed[pending] = pd.to_numeric(
+            value_str[pending]
+            .str.replace(".", "", regex=False)
+            .str.replace(",", ".", regex=False),
+            errors="coerce"
+        )
+    
+    result[present] = parsed.fillna(0.0).to_numpy()
+    return result
+
+
 def format_currency(value: float, symbol: str = "$") -> str:
     """Format a number as currency string.
     